@@ -21,6 +21,8 @@ os.environ.setdefault("PGCLIENTENCODING", "UTF8")
 from app.core.database import Base
 from app.core.config import settings
 from app.models import user  # noqa: F401
+from app.models import backfill  # noqa: F401
+from app.models import rate_limit  # noqa: F401
 from app.modules.workspace import models as workspace_models  # noqa: F401
 from app.modules.discovery import models as discovery_models  # noqa: F401
 from app.modules.delivery import models as delivery_models  # noqa: F401
@@ -0,0 +1,43 @@
+"""add inception publish jobs
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-18 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inception_publish_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("inception_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=True),
+        sa.Column("product_id", sa.Integer(), nullable=True),
+        sa.Column("blueprint_id", sa.Integer(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["inception_id"], ["inceptions.id"]),
+        sa.ForeignKeyConstraint(["product_id"], ["workspace_products.id"]),
+        sa.ForeignKeyConstraint(["blueprint_id"], ["product_blueprints.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("inception_id", name="uq_inception_publish_jobs_inception_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("inception_publish_jobs")
@@ -0,0 +1,34 @@
+"""add backfill runs and user journey name index
+
+Revision ID: d4e5f6a7b8c9
+Revises: c9d8e7f6a5b4
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, Sequence[str], None] = "c9d8e7f6a5b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backfill_runs",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("rows_affected", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.create_index("ix_user_journeys_name", "user_journeys", ["name"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_journeys_name", table_name="user_journeys")
+    op.drop_table("backfill_runs")
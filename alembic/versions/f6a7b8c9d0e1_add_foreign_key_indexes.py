@@ -0,0 +1,50 @@
+"""add indexes on filtered foreign keys
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18 00:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, Sequence[str], None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_problems_workspace_id", "problems", ["workspace_id"]),
+    ("ix_personas_problem_id", "personas", ["problem_id"]),
+    ("ix_user_journeys_persona_id", "user_journeys", ["persona_id"]),
+    ("ix_product_okrs_product_id", "product_okrs", ["product_id"]),
+    ("ix_stories_feature_id", "stories", ["feature_id"]),
+    ("ix_stories_workspace_id", "stories", ["workspace_id"]),
+    ("ix_inceptions_workspace_id", "inceptions", ["workspace_id"]),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction and does
+        # not block writes on large tenants while the index is built.
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _columns in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _columns in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
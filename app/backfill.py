@@ -0,0 +1,65 @@
+# app/backfill.py
+"""One-shot data backfills that used to run inside GET handlers.
+
+Each backfill is idempotent and records a row in ``backfill_runs`` once it
+completes, so running it again is a no-op unless ``--force`` is given::
+
+    python -m app.backfill journeys
+    python -m app.backfill all --force
+"""
+import argparse
+from datetime import datetime, timezone
+
+from app.core.database import SessionLocal
+from app.models import user  # noqa: F401
+from app.models.backfill import BackfillRun
+from app.modules.discovery.service import backfill_blueprint_journeys, backfill_blueprint_okrs
+from app.modules.workspace import models as workspace_models  # noqa: F401
+from app.modules.workspace.service import backfill_blueprint_boundaries
+
+BACKFILLS = {
+    "journeys": backfill_blueprint_journeys,
+    "okrs": backfill_blueprint_okrs,
+    "boundaries": backfill_blueprint_boundaries,
+}
+
+
+def run_backfill(name: str, force: bool = False) -> int | None:
+    """Run a backfill once; returns rows affected, or None when already completed."""
+    db = SessionLocal()
+    try:
+        run = db.get(BackfillRun, name)
+        if run and not force:
+            return None
+        rows_affected = BACKFILLS[name](db)
+        if not run:
+            run = BackfillRun(name=name)
+            db.add(run)
+        run.rows_affected = rows_affected
+        run.completed_at = datetime.now(timezone.utc)
+        db.commit()
+        return rows_affected
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("name", choices=[*BACKFILLS, "all"])
+    parser.add_argument("--force", action="store_true", help="run again even if already completed")
+    args = parser.parse_args(argv)
+
+    names = list(BACKFILLS) if args.name == "all" else [args.name]
+    for name in names:
+        rows_affected = run_backfill(name, force=args.force)
+        if rows_affected is None:
+            print(f"{name}: already completed, skipping (use --force to rerun)")
+        else:
+            print(f"{name}: {rows_affected} rows affected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# app/bootstrap.py
+"""Seed the admin user, the Default workspace and its membership.
+
+Runs from the app lifespan unless BOOTSTRAP_ON_STARTUP=false, and can be run
+once per deployment instead (e.g. as a release command)::
+
+    python -m app.bootstrap
+
+Only one process does the work at a time: Postgres uses a transaction-level
+advisory lock, SQLite a lock file next to the database. Processes that find
+the lock taken skip the bootstrap instead of waiting for it.
+"""
+import asyncio
+import os
+import tempfile
+from contextlib import contextmanager
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.security import hash_password_async, password_hasher
+from app.models.user import User
+from app.modules.workspace.models import Workspace, WorkspaceMember
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+# Arbitrary application-wide key for pg_try_advisory_xact_lock.
+ADVISORY_LOCK_KEY = 0x50524F44
+
+
+def _lock_file_path() -> str:
+    database = make_url(settings.database_url).database
+    if not database or database == ":memory:":
+        return os.path.join(tempfile.gettempdir(), "product-os-bootstrap.lock")
+    return f"{database}.bootstrap.lock"
+
+
+@contextmanager
+def _try_file_lock(path: str):
+    """Yield True when an exclusive, non-blocking lock on `path` was acquired."""
+    with open(path, "a+b") as handle:
+        try:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _insert_ignore(dialect_name: str, model):
+    """INSERT ... ON CONFLICT DO NOTHING for the dialects we deploy on."""
+    insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    return insert(model).on_conflict_do_nothing()
+
+
+async def _seed(db: AsyncSession, dialect_name: str) -> None:
+    user_id = None
+    if settings.admin_email:
+        user_id = await db.scalar(select(User.id).where(User.email == settings.admin_email))
+        if user_id is None and settings.admin_password:
+            password_hash = await hash_password_async(settings.admin_password)
+            await db.execute(
+                _insert_ignore(dialect_name, User).values(email=settings.admin_email, password_hash=password_hash)
+            )
+            user_id = await db.scalar(select(User.id).where(User.email == settings.admin_email))
+    if user_id is None:
+        user_id = await db.scalar(select(User.id).order_by(User.id.asc()).limit(1))
+    if user_id is None:
+        return
+
+    workspace_id = await db.scalar(select(Workspace.id).order_by(Workspace.id.asc()).limit(1))
+    if workspace_id is None:
+        await db.execute(_insert_ignore(dialect_name, Workspace).values(name="Default", owner_id=user_id))
+        workspace_id = await db.scalar(select(Workspace.id).where(Workspace.name == "Default"))
+
+    await db.execute(_insert_ignore(dialect_name, WorkspaceMember).values(workspace_id=workspace_id, user_id=user_id))
+
+
+async def bootstrap() -> bool:
+    """Seed default records in a single transaction; returns False when another process holds the lock."""
+    async with AsyncSessionLocal() as db:
+        dialect_name = db.bind.dialect.name
+        if dialect_name == "postgresql":
+            async with db.begin():
+                locked = await db.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+                if not locked:
+                    return False
+                await _seed(db, dialect_name)
+            return True
+
+        with _try_file_lock(_lock_file_path()) as locked:
+            if not locked:
+                return False
+            async with db.begin():
+                await _seed(db, dialect_name)
+        return True
+
+
+def main() -> None:
+    try:
+        ran = asyncio.run(bootstrap())
+    finally:
+        password_hasher.shutdown()
+    print("bootstrap: done" if ran else "bootstrap: another process holds the lock, skipping")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,11 @@ except Exception:  # pragma: no cover - optional dependency at runtime
 if "DATABASE_URL" not in os.environ:
     load_dotenv()
 
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
+
 @dataclass(frozen=True)
 class Settings:
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./app.db")
@@ -21,6 +26,56 @@ class Settings:
     )
     admin_email: str | None = os.getenv("ADMIN_EMAIL")
     admin_password: str | None = os.getenv("ADMIN_PASSWORD")
+    # Seed admin user/Default workspace at startup; disable when `python -m app.bootstrap`
+    # runs once per deployment instead.
+    bootstrap_on_startup: bool = _env_bool("BOOTSTRAP_ON_STARTUP", "true")
+    # Pool sizing applies per engine (sync and async) and per process:
+    # total backends ~= workers * 2 * (size + overflow).
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    db_pool_pre_ping: bool = _env_bool("DB_POOL_PRE_PING", "true")
+    # Statements slower than this are logged with their route; negative disables.
+    slow_query_threshold_ms: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    # Readiness probe: results are cached for health_cache_seconds; the instance is
+    # reported unavailable when a pool is at least this saturated (checked out / capacity).
+    health_cache_seconds: float = float(os.getenv("HEALTH_CACHE_SECONDS", "2"))
+    health_db_timeout_seconds: float = float(os.getenv("HEALTH_DB_TIMEOUT_SECONDS", "2"))
+    health_pool_saturation_threshold: float = float(os.getenv("HEALTH_POOL_SATURATION_THRESHOLD", "1.0"))
+    health_check_migrations: bool = _env_bool("HEALTH_CHECK_MIGRATIONS", "true")
+    # Queued or running publish jobs untouched for this long are assumed dead
+    # (e.g. the worker restarted) and may be re-queued.
+    publish_job_stale_seconds: float = float(os.getenv("PUBLISH_JOB_STALE_SECONDS", "900"))
+    page_size_default: int = int(os.getenv("PAGE_SIZE_DEFAULT", "100"))
+    page_size_max: int = int(os.getenv("PAGE_SIZE_MAX", "500"))
+    # Responses smaller than the minimum are sent uncompressed. Brotli is used
+    # for clients that accept it; without the `brotli` package, only gzip is.
+    compression_minimum_size: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+    gzip_level: int = int(os.getenv("GZIP_LEVEL", "6"))
+    brotli_quality: int = int(os.getenv("BROTLI_QUALITY", "5"))
+    # Bcrypt runs on a dedicated process pool so login bursts do not starve the
+    # request threadpool; logins beyond the queue limit are rejected with 503.
+    # Cost factor for new hashes; hashes with other rounds are rehashed on login.
+    bcrypt_rounds: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    password_hash_max_queue: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+    # Decoded tokens are cached until their exp; resolved users for a short TTL.
+    token_cache_size: int = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+    user_cache_ttl_seconds: float = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+    # Login token buckets (attempts per minute, also the burst size); 0 disables.
+    # "database" shares buckets across workers through rate_limit_buckets.
+    login_rate_limit_backend: str = os.getenv("LOGIN_RATE_LIMIT_BACKEND", "memory")
+    login_rate_limit_email_per_minute: int = int(os.getenv("LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE", "5"))
+    login_rate_limit_ip_per_minute: int = int(os.getenv("LOGIN_RATE_LIMIT_IP_PER_MINUTE", "20"))
+    # Opt-in request profiling, see app/core/profiling.py. Backend: auto, cprofile
+    # or pyinstrument; a negative slow threshold disables threshold-based capture.
+    profiling_enabled: bool = _env_bool("PROFILING_ENABLED", "false")
+    profiling_sample_rate: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+    profiling_slow_threshold_ms: float = float(os.getenv("PROFILING_SLOW_THRESHOLD_MS", "-1"))
+    profiling_dir: str = os.getenv("PROFILING_DIR", "profiles")
+    profiling_max_files: int = int(os.getenv("PROFILING_MAX_FILES", "100"))
+    profiling_backend: str = os.getenv("PROFILING_BACKEND", "auto")
 
 
 settings = Settings()
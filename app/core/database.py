@@ -1,17 +1,32 @@
+import os
+import threading
+import time
 import uuid
-from datetime import datetime
-from sqlalchemy import create_engine
+from datetime import datetime, timezone
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
 from app.core.config import settings
+from app.core.query_stats import after_cursor_execute, before_cursor_execute, handle_error
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def utcnow() -> datetime:
+    """Application-side `onupdate` clock.
+
+    CURRENT_TIMESTAMP only has second precision on SQLite, which is too coarse
+    for updated_at values that back ETags.
+    """
+    return datetime.now(timezone.utc)
+
+
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
         default=func.now(), nullable=False
@@ -31,13 +46,127 @@ class UUIDMixin:
     )
 
 
+class PoolCheckoutStats:
+    """Thread-safe counters for connection checkouts of a single pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "checkout_wait_avg_ms": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                "checkout_wait_max_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class _CheckoutTimingMixin:
+    """Records how long callers wait to check out a connection from the pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = PoolCheckoutStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.checkout_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _async_database_url(url: str) -> str:
+    """Map the configured sync URL to its async driver (aiosqlite / psycopg async)."""
+    scheme, separator, rest = url.partition("://")
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite{separator}{rest}"
+    if scheme.startswith(("postgresql", "postgres")):
+        return f"postgresql+psycopg{separator}{rest}"
+    return url
+
+
 connect_args = {}
 if settings.database_url.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
-engine = create_engine(settings.database_url, connect_args=connect_args)
+pool_options = {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout,
+    "pool_recycle": settings.db_pool_recycle,
+    "pool_pre_ping": settings.db_pool_pre_ping,
+}
+
+engine = create_engine(
+    settings.database_url,
+    connect_args=connect_args,
+    poolclass=TimedQueuePool,
+    **pool_options,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    _async_database_url(settings.database_url),
+    poolclass=TimedAsyncQueuePool,
+    **pool_options,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+for _sync_engine in (engine, async_engine.sync_engine):
+    event.listen(_sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(_sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(_sync_engine, "handle_error", handle_error)
+
+
+def _pool_snapshot(pool) -> dict:
+    stats = {
+        "pool_size": pool.size(),
+        "max_overflow": settings.db_max_overflow,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "timeout": settings.db_pool_timeout,
+        "recycle": settings.db_pool_recycle,
+        "pre_ping": settings.db_pool_pre_ping,
+    }
+    stats.update(pool.checkout_stats.snapshot())
+    return stats
+
+
+def pool_stats() -> dict:
+    """Snapshot of this process' connection pools, for sizing pools per worker."""
+    stats = {"pid": os.getpid()}
+    stats.update(_pool_snapshot(engine.pool))
+    stats["async"] = _pool_snapshot(async_engine.sync_engine.pool)
+    return stats
+
 
 def get_db():
     db = SessionLocal()
@@ -45,3 +174,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
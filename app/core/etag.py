@@ -0,0 +1,35 @@
+# app/core/etag.py
+import hashlib
+
+from fastapi import Request, Response
+
+
+def compute_etag(*parts) -> str:
+    """Strong ETag from the values that identify a resource version (ids, updated_at, counts)."""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison, as RFC 9110 requires for If-None-Match."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(tag) for tag in header.split(",")}
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Response | None:
+    """Tag the response; return a 304 to send instead when the client already has this version."""
+    # no-cache: browsers keep the body but revalidate with If-None-Match on every fetch.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
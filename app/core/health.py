@@ -0,0 +1,84 @@
+# app/core/health.py
+import asyncio
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.core.database import async_engine, pool_stats
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+_alembic_heads: set[str] | None = None
+_cached_readiness: tuple[float, dict] | None = None
+
+
+def _migration_heads() -> set[str]:
+    """Head revisions of the migration scripts shipped with this build (read once)."""
+    global _alembic_heads
+    if _alembic_heads is None:
+        from alembic.config import Config
+        from alembic.script import ScriptDirectory
+
+        config = Config()
+        config.set_main_option("script_location", str(ALEMBIC_DIR))
+        _alembic_heads = set(ScriptDirectory.from_config(config).get_heads())
+    return _alembic_heads
+
+
+def _pool_saturation(stats: dict) -> float:
+    capacity = stats["pool_size"] + max(stats["max_overflow"], 0)
+    return stats["checked_out"] / capacity if capacity else 0.0
+
+
+async def _database_versions() -> set[str] | None:
+    """Run the SELECT 1 probe and read alembic_version on the same connection."""
+    async with async_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+        if not settings.health_check_migrations:
+            return None
+        try:
+            result = await connection.execute(text("SELECT version_num FROM alembic_version"))
+        except DBAPIError:
+            return set()  # never stamped by Alembic
+        return {row[0] for row in result}
+
+
+async def _check_readiness() -> dict:
+    checks: dict[str, dict] = {}
+
+    stats = pool_stats()
+    saturation = max(_pool_saturation(stats), _pool_saturation(stats["async"]))
+    checks["pool"] = {
+        "ok": saturation < settings.health_pool_saturation_threshold,
+        "saturation": round(saturation, 3),
+    }
+
+    started = time.perf_counter()
+    try:
+        versions = await asyncio.wait_for(_database_versions(), timeout=settings.health_db_timeout_seconds)
+    except asyncio.TimeoutError:
+        checks["database"] = {"ok": False, "error": "timeout"}
+    except Exception as exc:
+        checks["database"] = {"ok": False, "error": type(exc).__name__}
+    else:
+        checks["database"] = {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+        if versions is not None:
+            heads = _migration_heads()
+            checks["migrations"] = {"ok": versions == heads, "database": sorted(versions), "head": sorted(heads)}
+
+    ready = all(check["ok"] for check in checks.values())
+    return {"status": "ok" if ready else "unavailable", "checks": checks}
+
+
+async def readiness() -> dict:
+    """Readiness report, cached for a short interval so frequent probes add no DB load."""
+    global _cached_readiness
+    now = time.monotonic()
+    if _cached_readiness and now - _cached_readiness[0] < settings.health_cache_seconds:
+        return _cached_readiness[1]
+    report = await _check_readiness()
+    _cached_readiness = (now, report)
+    return report
@@ -0,0 +1,256 @@
+# app/core/metrics.py
+"""In-process request metrics, exposed in the Prometheus text format at /metrics.
+
+Counters live in this process only: with several workers, each one serves its
+own series and the scrape lands on whichever worker accepts it, so run one
+scrape target per worker (or a single worker per instance) when setting SLOs.
+"""
+import math
+import threading
+import time
+
+from app.core.query_stats import current_query_stats
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# Requests that match no route are grouped under one label instead of their
+# raw path, so scanners can't grow the number of series without bound.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _format_labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter keyed by a tuple of label values."""
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        lines.extend(
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in values
+        )
+        return lines
+
+
+class Gauge:
+    """Value that goes up and down, e.g. requests currently being served."""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        with self._lock:
+            return self._value
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_format_value(self.value)}",
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values."""
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> [per-bucket counts (non-cumulative, last is +Inf), sum, count]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, *label_values) -> None:
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *label_values) -> int:
+        with self._lock:
+            series = self._series.get(label_values)
+            return series[2] if series else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            snapshot = sorted((key, (list(series[0]), series[1], series[2])) for key, series in self._series.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count) in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                labels = _format_labels((*self.labels, "le"), (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve a request, from the first byte received to the last byte sent.",
+    ("method", "route"),
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_sql_statements",
+    "SQL statements executed while serving a request.",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+IN_FLIGHT = Gauge("http_requests_in_flight", "Requests currently being served.")
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time password hashing jobs waited for a free worker process.",
+)
+
+
+def _route_template(scope: dict) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Records count, latency and SQL statements per route template.
+
+    Must run inside QueryStatsMiddleware to see the request's statement count.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            IN_FLIGHT.dec()
+            elapsed = time.perf_counter() - started
+            method, route = scope["method"], _route_template(scope)
+            REQUESTS.inc(method, route, status)
+            REQUEST_LATENCY.observe(elapsed, method, route)
+            stats = current_query_stats()
+            if stats is not None:
+                REQUEST_QUERIES.observe(stats.count, method, route)
+
+
+def _gauge_lines(name: str, documentation: str, samples: list[tuple[dict, float]], kind: str = "gauge") -> list[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(value)}")
+    return lines
+
+
+def _pool_lines() -> list[str]:
+    from app.core.database import pool_stats
+
+    stats = pool_stats()
+    pools = [({"pool": "sync"}, stats), ({"pool": "async"}, stats["async"])]
+    lines = []
+    for key, documentation, kind in (
+        ("pool_size", "Configured number of persistent connections.", "gauge"),
+        ("checked_out", "Connections currently checked out of the pool.", "gauge"),
+        ("checked_in", "Idle connections held by the pool.", "gauge"),
+        ("overflow", "Connections opened beyond pool_size (negative while the pool is filling).", "gauge"),
+        ("checkouts", "Successful connection checkouts.", "counter"),
+        ("checkout_timeouts", "Checkouts that gave up after pool_timeout.", "counter"),
+    ):
+        name = f"db_pool_{key}_total" if kind == "counter" else f"db_pool_{key}"
+        lines.extend(_gauge_lines(name, documentation, [(labels, pool[key]) for labels, pool in pools], kind))
+    return lines
+
+
+def _password_hashing_lines() -> list[str]:
+    # Imported here: security imports this module to record its queue wait.
+    from app.core.security import password_hasher
+
+    stats = password_hasher.stats()
+    lines = _gauge_lines("password_hash_in_flight", "Password hashing jobs queued or running.", [({}, stats["in_flight"])])
+    lines.extend(
+        _gauge_lines("password_hash_queue_depth", "Password hashing jobs waiting for a worker.", [({}, stats["queue_depth"])])
+    )
+    lines.extend(PASSWORD_HASH_QUEUE_WAIT.render())
+    return lines
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in (REQUESTS, REQUEST_LATENCY, REQUEST_QUERIES, IN_FLIGHT):
+        lines.extend(metric.render())
+    lines.extend(_pool_lines())
+    lines.extend(_password_hashing_lines())
+    return "\n".join(lines) + "\n"
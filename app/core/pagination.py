@@ -0,0 +1,111 @@
+# app/core/pagination.py
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Sequence
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import Select, and_, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """`cursor`/`limit` query parameters shared by every list endpoint."""
+
+    def __init__(
+        self,
+        cursor: str | None = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+        limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps([str(value) if value is not None else None for value in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def _coerce(column, value):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+def decode_cursor(cursor: str, key_columns: Sequence) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(key_columns):
+            raise ValueError("cursor does not match sort key")
+        return [_coerce(column, value) for column, value in zip(key_columns, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _comparable(column, value, sqlite: bool):
+    # SQLite stores server-side timestamps as "YYYY-MM-DD HH:MM:SS" text while
+    # bound datetimes carry microseconds, so compare both in the same format.
+    if sqlite and isinstance(value, datetime):
+        return func.datetime(column), func.datetime(value)
+    return column, value
+
+
+def _after(key_columns: Sequence, values: Sequence, descending: bool, sqlite: bool = False):
+    # Lexicographic "row comes after cursor" without relying on row-value support.
+    pairs = [_comparable(column, value, sqlite) for column, value in zip(key_columns, values)]
+    clauses = []
+    for index, (column, value) in enumerate(pairs):
+        equal_prefix = [prefix_column == prefix_value for prefix_column, prefix_value in pairs[:index]]
+        beyond = column < value if descending else column > value
+        clauses.append(and_(*equal_prefix, beyond))
+    return or_(*clauses)
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    page: PageParams,
+    key_columns: Sequence,
+    descending: bool = False,
+) -> tuple[list, str | None]:
+    """Return one keyset page of `query` ordered by `key_columns` (last one must be unique)
+    and the cursor of the following page, if any.
+    """
+    if page.cursor:
+        values = decode_cursor(page.cursor, key_columns)
+        query = query.where(_after(key_columns, values, descending, sqlite=db.bind.dialect.name == "sqlite"))
+    ordering = [column.desc() if descending else column.asc() for column in key_columns]
+    result = await db.execute(query.order_by(*ordering).limit(page.limit + 1))
+    items = result.scalars().all()
+    if len(items) <= page.limit:
+        return items, None
+    items = items[: page.limit]
+    return items, encode_cursor([getattr(items[-1], column.key) for column in key_columns])
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    page: PageParams,
+    response: Response,
+    key_columns: Sequence,
+    descending: bool = False,
+) -> list:
+    """Like fetch_page, but sends the next cursor in the X-Next-Cursor header so
+    list bodies keep their shape.
+    """
+    items, next_cursor = await fetch_page(db, query, page, key_columns, descending)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
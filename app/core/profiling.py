@@ -0,0 +1,201 @@
+# app/core/profiling.py
+"""Opt-in profiling of sampled or slow requests (PROFILING_ENABLED=true).
+
+A request is profiled when it is sampled at PROFILING_SAMPLE_RATE, or, with
+PROFILING_SLOW_THRESHOLD_MS >= 0, it is profiled and the profile is kept only
+if the request ran at least that long. One request per process is profiled
+at a time. While a request is profiled on the event loop thread, the profile
+also picks up any other coroutines that ran in the meantime.
+
+Profiles use pyinstrument (.html) when it is installed, otherwise cProfile
+(.prof, open with `python -m pstats` or snakeviz). They are written to
+PROFILING_DIR as ``<utc timestamp>--<method>--<route>--<ms>ms<suffix>``, and
+only the newest PROFILING_MAX_FILES are kept.
+"""
+import cProfile
+import functools
+import inspect
+import pstats
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+PROFILE_SUFFIXES = (".prof", ".html")
+
+_active_profile: ContextVar["RequestProfile | None"] = ContextVar("active_profile", default=None)
+_profile_slot = threading.Lock()
+
+
+def _pyinstrument_available() -> bool:
+    try:
+        import pyinstrument  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class RequestProfile:
+    """Profilers started for one request: the event loop thread plus any threadpool calls."""
+
+    def __init__(self, use_pyinstrument: bool):
+        self.use_pyinstrument = use_pyinstrument
+        self.suffix = ".html" if use_pyinstrument else ".prof"
+        self._lock = threading.Lock()
+        self._profilers = []
+
+    def start(self, in_event_loop: bool):
+        if self.use_pyinstrument:
+            from pyinstrument import Profiler
+
+            profiler = Profiler(async_mode="enabled" if in_event_loop else "disabled")
+            profiler.start()
+        else:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Python 3.12+ allows a single cProfile per interpreter.
+                return None
+        with self._lock:
+            self._profilers.append(profiler)
+        return profiler
+
+    def stop(self, profiler) -> None:
+        if profiler is None:
+            return
+        if self.use_pyinstrument:
+            profiler.stop()
+        else:
+            profiler.disable()
+
+    def write(self, path: Path) -> None:
+        with self._lock:
+            profilers = list(self._profilers)
+        if not profilers:
+            return
+        if self.use_pyinstrument:
+            from pyinstrument.renderers import HTMLRenderer
+            from pyinstrument.session import Session
+
+            session = functools.reduce(Session.combine, (profiler.last_session for profiler in profilers))
+            path.write_text(HTMLRenderer().render(session), encoding="utf-8")
+        else:
+            pstats.Stats(*profilers).dump_stats(path)
+
+
+class ProfiledRoute(APIRoute):
+    """APIRoute that also profiles sync endpoints, which FastAPI runs on threadpool threads."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if not inspect.iscoroutinefunction(endpoint):
+            endpoint = _profile_in_thread(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _profile_in_thread(endpoint):
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        profile = _active_profile.get()
+        if profile is None:
+            return endpoint(*args, **kwargs)
+        profiler = profile.start(in_event_loop=False)
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            profile.stop(profiler)
+
+    return wrapper
+
+
+def _route_slug(scope: dict) -> str:
+    route = getattr(scope.get("route"), "path", None) or "unmatched"
+    return re.sub(r"[^A-Za-z0-9_]+", ".", route).strip(".") or "root"
+
+
+def list_profiles(directory: str | Path) -> list[Path]:
+    """Stored profiles, newest first."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    profiles = [path for path in directory.iterdir() if path.suffix in PROFILE_SUFFIXES and path.is_file()]
+    return sorted(profiles, key=lambda path: path.name, reverse=True)
+
+
+def parse_profile_name(name: str) -> dict | None:
+    """Split a stored profile's file name into its parts; None for foreign files."""
+    stem, _, suffix = name.rpartition(".")
+    parts = stem.split("--")
+    if len(parts) != 4 or not parts[3].endswith("ms") or f".{suffix}" not in PROFILE_SUFFIXES:
+        return None
+    stamp, method, route, duration = parts
+    try:
+        created_at = datetime.strptime(stamp, "%Y%m%dT%H%M%S%fZ").replace(tzinfo=timezone.utc)
+        duration_ms = int(duration[:-2])
+    except ValueError:
+        return None
+    return {"created_at": created_at, "method": method, "route": route, "duration_ms": duration_ms}
+
+
+class ProfilingMiddleware:
+    """Profiles sampled or slow requests and stores the profiles with rotation."""
+
+    def __init__(
+        self,
+        app,
+        directory: str,
+        sample_rate: float = 0.0,
+        slow_threshold_ms: float = -1.0,
+        max_files: int = 100,
+        backend: str = "auto",
+    ):
+        self.app = app
+        self.directory = Path(directory)
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.max_files = max_files
+        if backend == "auto":
+            self.use_pyinstrument = _pyinstrument_available()
+        else:
+            self.use_pyinstrument = backend == "pyinstrument"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not (sampled or self.slow_threshold_ms >= 0) or not _profile_slot.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            profile = RequestProfile(self.use_pyinstrument)
+            token = _active_profile.set(profile)
+            started = time.perf_counter()
+            profiler = profile.start(in_event_loop=True)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                profile.stop(profiler)
+                _active_profile.reset(token)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                slow = self.slow_threshold_ms >= 0 and elapsed_ms >= self.slow_threshold_ms
+                if sampled or slow:
+                    await run_in_threadpool(self._store, profile, scope, elapsed_ms)
+        finally:
+            _profile_slot.release()
+
+    def _store(self, profile: RequestProfile, scope: dict, elapsed_ms: float) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        name = f"{stamp}--{scope['method']}--{_route_slug(scope)}--{round(elapsed_ms)}ms{profile.suffix}"
+        profile.write(self.directory / name)
+        for stale in list_profiles(self.directory)[self.max_files:]:
+            stale.unlink(missing_ok=True)
@@ -0,0 +1,117 @@
+# app/core/rate_limit.py
+import hashlib
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.rate_limit import RateLimitBucket
+
+
+@dataclass(frozen=True)
+class BucketPolicy:
+    capacity: float
+    refill_per_second: float
+
+    @classmethod
+    def per_minute(cls, limit: int) -> "BucketPolicy":
+        return cls(capacity=float(limit), refill_per_second=limit / 60.0)
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def take(self, tokens: float, elapsed: float) -> tuple[float, float]:
+        """Refill, then try to take one token. Returns (tokens left, retry after seconds)."""
+        tokens = min(self.capacity, tokens + max(0.0, elapsed) * self.refill_per_second)
+        if tokens >= 1:
+            return tokens - 1, 0.0
+        return tokens, (1 - tokens) / self.refill_per_second
+
+
+class MemoryRateLimitBackend:
+    """Per-process buckets; idle buckets are dropped once they would be full again."""
+
+    def __init__(self, max_keys: int = 10_000, clock=time.monotonic):
+        self._buckets = TTLCache(max_keys)
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    async def hit(self, key: str, policy: BucketPolicy) -> float:
+        with self._lock:
+            now = self._clock()
+            tokens, updated_at = self._buckets.get(key, (policy.capacity, now))
+            tokens, retry_after = policy.take(tokens, now - updated_at)
+            self._buckets.set(key, (tokens, now), (policy.capacity - tokens) / policy.refill_per_second)
+            return retry_after
+
+
+class DatabaseRateLimitBackend:
+    """Buckets stored in rate_limit_buckets so every worker shares the same limits."""
+
+    def __init__(self, session_factory=AsyncSessionLocal, clock=time.time):
+        self._session_factory = session_factory
+        self._clock = clock
+
+    async def hit(self, key: str, policy: BucketPolicy) -> float:
+        for _ in range(2):
+            async with self._session_factory() as db:
+                now = self._clock()
+                bucket = (
+                    await db.execute(select(RateLimitBucket).where(RateLimitBucket.key == key).with_for_update())
+                ).scalars().first()
+                if bucket is None:
+                    tokens, retry_after = policy.take(policy.capacity, 0)
+                    db.add(RateLimitBucket(key=key, tokens=tokens, updated_at=now))
+                else:
+                    tokens, retry_after = policy.take(bucket.tokens, now - bucket.updated_at)
+                    bucket.tokens = tokens
+                    bucket.updated_at = now
+                try:
+                    await db.commit()
+                except IntegrityError:
+                    # Another worker created the bucket concurrently; retry against its row.
+                    await db.rollback()
+                    continue
+                return retry_after
+        return 0.0
+
+
+class LoginRateLimiter:
+    """Token buckets per login email and per client IP."""
+
+    def __init__(self, backend, email_policy: BucketPolicy, ip_policy: BucketPolicy):
+        self.backend = backend
+        self.email_policy = email_policy
+        self.ip_policy = ip_policy
+
+    async def hit(self, email: str, client_ip: str | None) -> int:
+        """Consume one attempt; returns the seconds to wait, or 0 when allowed."""
+        retry_after = 0.0
+        if self.ip_policy.enabled and client_ip:
+            retry_after = max(retry_after, await self.backend.hit(f"login:ip:{client_ip}", self.ip_policy))
+        if self.email_policy.enabled:
+            # Hashed: the login email is unvalidated and may not fit the bucket key column.
+            email_digest = hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+            email_key = f"login:email:{email_digest}"
+            retry_after = max(retry_after, await self.backend.hit(email_key, self.email_policy))
+        return math.ceil(retry_after)
+
+
+def _backend_from_settings():
+    if settings.login_rate_limit_backend == "database":
+        return DatabaseRateLimitBackend()
+    return MemoryRateLimitBackend()
+
+
+login_rate_limiter = LoginRateLimiter(
+    _backend_from_settings(),
+    email_policy=BucketPolicy.per_minute(settings.login_rate_limit_email_per_minute),
+    ip_policy=BucketPolicy.per_minute(settings.login_rate_limit_ip_per_minute),
+)
@@ -1,11 +1,33 @@
 # app/core/security.py
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from jose import jwt
-from passlib.context import CryptContext
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.database import get_async_db
+from app.models.user import User
+import asyncio
 import hashlib
+import multiprocessing
+import threading
+import time
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib and python-jose are imported on first use: most processes that import
+# this module (and every cold start) never hash a password before the first login.
+_pwd_context = None
+
+
+def get_pwd_context():
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
+    return _pwd_context
 
 
 def _pre_hash_password(password: str) -> str:
@@ -18,15 +40,122 @@ def _pre_hash_password(password: str) -> str:
 
 def hash_password(password: str) -> str:
     pre_hashed = _pre_hash_password(password)
-    return pwd_context.hash(pre_hashed)
+    return get_pwd_context().hash(pre_hashed)
 
 
 def verify_password(password: str, hashed: str) -> bool:
     pre_hashed = _pre_hash_password(password)
-    return pwd_context.verify(pre_hashed, hashed)
+    return get_pwd_context().verify(pre_hashed, hashed)
+
+
+def verify_and_update_password(password: str, hashed: str) -> tuple[bool, str | None]:
+    """Verify a password; on success also return a new hash if the stored one is outdated."""
+    pre_hashed = _pre_hash_password(password)
+    return get_pwd_context().verify_and_update(pre_hashed, hashed)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded process pool, off the event loop and request threads."""
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs threads is unsafe.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    async def _submit(self, fn, *args):
+        with self._lock:
+            if self._in_flight - self.workers >= self.max_queue:
+                raise PasswordHasherBusy()
+            self._in_flight += 1
+        try:
+            submitted_at = time.time()
+            loop = asyncio.get_running_loop()
+            started_at, result = await loop.run_in_executor(self._get_executor(), _timed, fn, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        wait = max(0.0, started_at - submitted_at)
+        with self._lock:
+            self._completed += 1
+            self._queue_wait_total += wait
+            self._queue_wait_max = max(self._queue_wait_max, wait)
+        # Imported here so the spawned worker processes, which import this module, skip the metrics module.
+        from app.core.metrics import PASSWORD_HASH_QUEUE_WAIT
+
+        PASSWORD_HASH_QUEUE_WAIT.observe(wait)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit(verify_password, password, hashed)
+
+    async def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        return await self._submit(verify_and_update_password, password, hashed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.workers,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.workers),
+                "max_queue": self.max_queue,
+                "completed": completed,
+                "queue_wait_avg_ms": round(self._queue_wait_total / completed * 1000, 3) if completed else 0.0,
+                "queue_wait_max_ms": round(self._queue_wait_max * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _timed(fn, *args):
+    """Worker-side wrapper reporting when the job actually started running."""
+    return time.time(), fn(*args)
+
+
+password_hasher = PasswordHasher(settings.password_hash_workers, settings.password_hash_max_queue)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.hash(password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    return await password_hasher.verify(password, hashed)
+
+
+async def verify_and_update_password_async(password: str, hashed: str) -> tuple[bool, str | None]:
+    return await password_hasher.verify_and_update(password, hashed)
 
 
 def create_access_token(data: dict):
+    from jose import jwt
+
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(
         minutes=settings.access_token_expire_minutes
@@ -38,3 +167,65 @@ def create_access_token(data: dict):
         algorithm=settings.algorithm
     )
 
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    id: int
+    email: str
+
+
+bearer_scheme = HTTPBearer(auto_error=False)
+_token_cache = TTLCache(settings.token_cache_size)
+_user_cache = TTLCache(settings.token_cache_size)
+
+
+def _credentials_error() -> HTTPException:
+    return HTTPException(
+        status_code=401,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def decode_access_token(token: str) -> dict:
+    """Decode and validate a token, reusing the result until the token expires."""
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    claims = _token_cache.get(key)
+    if claims is not None:
+        return claims
+    from jose import JWTError, jwt
+
+    try:
+        claims = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    except JWTError:
+        raise _credentials_error()
+    if not claims.get("sub") or "exp" not in claims:
+        raise _credentials_error()
+    _token_cache.set(key, claims, claims["exp"] - time.time())
+    return claims
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> CurrentUser:
+    if credentials is None or credentials.scheme.lower() != "bearer":
+        raise _credentials_error()
+    claims = decode_access_token(credentials.credentials)
+    email = claims["sub"]
+
+    current_user = _user_cache.get(email)
+    if current_user is None:
+        user = (await db.execute(select(User).where(User.email == email))).scalars().first()
+        if user is None:
+            raise _credentials_error()
+        current_user = CurrentUser(id=user.id, email=user.email)
+        _user_cache.set(email, current_user, settings.user_cache_ttl_seconds)
+    return current_user
+
+
+async def get_admin_user(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    if not settings.admin_email or current_user.email != settings.admin_email:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return current_user
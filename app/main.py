@@ -1,24 +1,44 @@
 # app/main.py
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.modules.auth.router import router as auth_router
 from app.modules.workspace.router import router as workspace_router
 from app.modules.discovery.routes import router as discovery_router
 from app.modules.delivery.routes import router as delivery_router
 from app.modules.inceptions.routes import router as inceptions_router
-from app.modules.workspace.models import Workspace, WorkspaceMember
+from app.modules.admin.router import router as admin_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.database import SessionLocal
-from app.core.security import hash_password
-from app.models.user import User
+from app.bootstrap import bootstrap
+from app.core.database import pool_stats
+from app.core.health import readiness
+from app.core.profiling import ProfilingMiddleware
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, render_metrics
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.security import password_hasher
+
+
+
+
 
 
 
+logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.bootstrap_on_startup and not await bootstrap():
+        logger.info("Bootstrap skipped: another worker holds the lock")
+    yield
+    password_hasher.shutdown()
 
 
-app = FastAPI(title="Product OS")
+app = FastAPI(title="Product OS", lifespan=lifespan)
 
 allowed_origins = [
     "http://localhost:5173",
@@ -36,59 +56,60 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing", "X-Next-Cursor"],
 )
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.gzip_level,
+    brotli_quality=settings.brotli_quality,
+)
+# Outermost, so writing a profile after the response does not count towards /metrics latency.
+if settings.profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        directory=settings.profiling_dir,
+        sample_rate=settings.profiling_sample_rate,
+        slow_threshold_ms=settings.profiling_slow_threshold_ms,
+        max_files=settings.profiling_max_files,
+        backend=settings.profiling_backend,
+    )
 
 app.include_router(auth_router)
 app.include_router(workspace_router)
 app.include_router(discovery_router)
 app.include_router(delivery_router)
 app.include_router(inceptions_router)
+app.include_router(admin_router)
 
 
-@app.on_event("startup")
-def ensure_admin_user():
-    """Ensure at least one user/workspace pair exists for discovery records."""
-    db = SessionLocal()
-    try:
-        user = None
-        if settings.admin_email:
-            user = db.query(User).filter(User.email == settings.admin_email).first()
-
-        if not user and settings.admin_email and settings.admin_password:
-            user = User(
-                email=settings.admin_email,
-                password_hash=hash_password(settings.admin_password),
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-
-        if not user:
-            user = db.query(User).order_by(User.id.asc()).first()
-        if not user:
-            return
-
-        workspace = db.query(Workspace).order_by(Workspace.id.asc()).first()
-        if not workspace:
-            workspace = Workspace(name="Default", owner_id=user.id)
-            db.add(workspace)
-            db.commit()
-            db.refresh(workspace)
-
-        member = (
-            db.query(WorkspaceMember)
-            .filter(
-                WorkspaceMember.workspace_id == workspace.id,
-                WorkspaceMember.user_id == user.id,
-            )
-            .first()
-        )
-        if not member:
-            db.add(WorkspaceMember(workspace_id=workspace.id, user_id=user.id))
-            db.commit()
-    finally:
-        db.close()
-
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@app.get("/health/live")
+def health_live():
+    """Liveness: the process is serving requests; never touches the database."""
+    return {"status": "ok"}
+
+
+@app.get("/health/ready")
+async def health_ready(response: Response):
+    """Readiness: database reachable, pools not saturated, schema at the migration head."""
+    report = await readiness()
+    if report["status"] != "ok":
+        response.status_code = 503
+    return report
+
+
+@app.get("/health/pool")
+def health_pool():
+    return {**pool_stats(), "password_hashing": password_hasher.stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
@@ -0,0 +1,16 @@
+# app/models/backfill.py
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.database import Base
+
+
+class BackfillRun(Base):
+    """Completion marker for one-shot data backfills (see app/backfill.py)."""
+
+    __tablename__ = "backfill_runs"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    rows_affected: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,14 @@
+# app/models/rate_limit.py
+from sqlalchemy import Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.database import Base
+
+
+class RateLimitBucket(Base):
+    """Token-bucket state shared by all workers (see app/core/rate_limit.py)."""
+
+    __tablename__ = "rate_limit_buckets"
+
+    key: Mapped[str] = mapped_column(String(320), primary_key=True)
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[float] = mapped_column(Float, nullable=False)
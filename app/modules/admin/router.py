@@ -0,0 +1,28 @@
+# app/modules/admin/router.py
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+from app.core.config import settings
+from app.core.profiling import list_profiles, parse_profile_name
+from app.core.security import get_admin_user
+from app.modules.admin.schemas import ProfileResponse
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(get_admin_user)])
+
+
+@router.get("/profiles", response_model=list[ProfileResponse])
+def list_request_profiles():
+    profiles = []
+    for path in list_profiles(settings.profiling_dir):
+        parts = parse_profile_name(path.name)
+        if parts is not None:
+            profiles.append(ProfileResponse(name=path.name, size_bytes=path.stat().st_size, **parts))
+    return profiles
+
+
+@router.get("/profiles/{name}")
+def download_request_profile(name: str):
+    path = next((path for path in list_profiles(settings.profiling_dir) if path.name == name), None)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    media_type = "text/html" if path.suffix == ".html" else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=path.name)
@@ -0,0 +1,11 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class ProfileResponse(BaseModel):
+    name: str
+    method: str
+    route: str
+    duration_ms: int
+    size_bytes: int
+    created_at: datetime
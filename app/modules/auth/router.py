@@ -1,24 +1,51 @@
 # app/modules/auth/router.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
-from app.core.security import verify_password, create_access_token
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
+from app.core.rate_limit import login_rate_limiter
+from app.core.security import (
+    CurrentUser,
+    PasswordHasherBusy,
+    create_access_token,
+    get_current_user,
+    verify_and_update_password_async,
+)
 from app.models.user import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+async def limit_login_attempts(request: Request, email: str):
+    client_ip = request.client.host if request.client else None
+    retry_after = await login_rate_limiter.hit(email, client_ip)
+    if retry_after:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(retry_after)},
+        )
+
 
-@router.post("/login")
-def login(email: str, password: str, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(password, user.password_hash):
+@router.post("/login", dependencies=[Depends(limit_login_attempts)])
+async def login(email: str, password: str, db: AsyncSession = Depends(get_async_db)):
+    user = (await db.execute(select(User).where(User.email == email))).scalars().first()
+    if user is None:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    try:
+        valid, new_hash = await verify_and_update_password_async(password, user.password_hash)
+    except PasswordHasherBusy:
+        raise HTTPException(status_code=503, detail="Too many login attempts in progress", headers={"Retry-After": "1"})
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    if new_hash:
+        # Cost factor changed since this hash was made: migrate the user lazily.
+        user.password_hash = new_hash
+        await db.commit()
 
     token = create_access_token({"sub": user.email})
     return {"access_token": token}
+
+
+@router.get("/me")
+async def me(current_user: CurrentUser = Depends(get_current_user)):
+    return {"id": current_user.id, "email": current_user.email}
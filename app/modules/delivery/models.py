@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Enum, Integer
+from sqlalchemy import Column, DateTime, String, Text, ForeignKey, Enum, Index, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 import uuid
 import enum
 
@@ -39,20 +40,25 @@ class Feature(Base):
     effort_estimate = Column(Integer, nullable=True)
     ux_estimate = Column(Integer, nullable=True)
     status = Column(Enum(FeatureStatus), default=FeatureStatus.todo)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     stories = relationship("Story", back_populates="feature")
 
 
 class Story(Base):
     __tablename__ = "stories"
+    __table_args__ = (
+        Index("ix_stories_workspace_id_status", "workspace_id", "status"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    feature_id = Column(UUID(as_uuid=True), ForeignKey("features.id"), nullable=True)
-    workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=True)
+    feature_id = Column(UUID(as_uuid=True), ForeignKey("features.id"), nullable=True, index=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=True, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     acceptance_criteria = Column(Text)
     estimate = Column(Integer)
     status = Column(Enum(StoryStatus), default=StoryStatus.todo)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     feature = relationship("Feature", back_populates="stories")
@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import delete, func, insert, select
+import uuid
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
+from app.core.pagination import PageParams, fetch_page, paginate
+from app.core.profiling import ProfiledRoute
 from app.modules.delivery import models, schemas
 from app.modules.workspace.models import ProductBlueprint, Workspace, WorkspaceProduct
 from app.modules.discovery.models import Persona, UserJourney
 from app.modules.inceptions.models import InceptionStep
 
-router = APIRouter(prefix="/delivery", tags=["Delivery"])
+router = APIRouter(prefix="/delivery", tags=["Delivery"], route_class=ProfiledRoute)
 
 
 def _first_product_id(db: Session) -> int | None:
@@ -41,11 +45,16 @@ def _validate_feature_links(
 
 
 @router.get("/features", response_model=list[schemas.FeatureResponse])
-def list_features(product_id: int | None = None, db: Session = Depends(get_db)):
-    query = db.query(models.Feature)
+async def list_features(
+    response: Response,
+    product_id: int | None = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    query = select(models.Feature)
     if product_id is not None:
-        query = query.filter(models.Feature.product_id == product_id)
-    return query.all()
+        query = query.where(models.Feature.product_id == product_id)
+    return await paginate(db, query, page, response, (models.Feature.created_at, models.Feature.id))
 
 
 @router.post("/features", response_model=schemas.FeatureResponse)
@@ -170,49 +179,41 @@ def import_features_from_inception(
         return schemas.FeatureImportFromInceptionResponse(imported_count=0, skipped_count=0)
 
     if data.overwrite_existing:
-        db.query(models.Feature).filter(models.Feature.product_id == product_id).delete()
-        db.flush()
+        db.execute(delete(models.Feature).where(models.Feature.product_id == product_id))
+        existing_titles: set[str] = set()
+    else:
+        existing_titles = set(
+            db.scalars(select(models.Feature.title).where(models.Feature.product_id == product_id))
+        )
 
-    imported_count = 0
+    rows: list[dict] = []
     skipped_count = 0
     for item in snapshot_features:
         title = str(item.get("text") or "").strip()
-        if not title:
-            skipped_count += 1
-            continue
-        exists = (
-            db.query(models.Feature)
-            .filter(
-                and_(
-                    models.Feature.product_id == product_id,
-                    models.Feature.title == title,
-                )
-            )
-            .first()
-        )
-        if exists:
+        # Skips titles already on the product and repeats within the snapshot itself.
+        if not title or title in existing_titles:
             skipped_count += 1
             continue
+        existing_titles.add(title)
 
         what = str(item.get("what") or "medium").strip().lower()
         how = str(item.get("how") or "medium").strip().lower()
-        complexity = _complexity_from_confidence(what, how)
-        business_estimate = _parse_estimate(item.get("business"))
-        effort_estimate = _parse_estimate(item.get("effort"))
-        ux_estimate = _parse_estimate(item.get("ux"))
-
-        feature = models.Feature(
-            product_id=product_id,
-            title=title,
-            description=None,
-            complexity=complexity,
-            business_estimate=business_estimate,
-            effort_estimate=effort_estimate,
-            ux_estimate=ux_estimate,
-            status=models.FeatureStatus.todo,
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "product_id": product_id,
+                "title": title,
+                "description": None,
+                "complexity": models.FeatureComplexity(_complexity_from_confidence(what, how)),
+                "business_estimate": _parse_estimate(item.get("business")),
+                "effort_estimate": _parse_estimate(item.get("effort")),
+                "ux_estimate": _parse_estimate(item.get("ux")),
+                "status": models.FeatureStatus.todo,
+            }
         )
-        db.add(feature)
-        imported_count += 1
+
+    if rows:
+        db.execute(insert(models.Feature).values(rows))
 
     try:
         db.commit()
@@ -220,14 +221,106 @@ def import_features_from_inception(
         db.rollback()
         raise HTTPException(status_code=400, detail="Invalid feature import payload")
     return schemas.FeatureImportFromInceptionResponse(
-        imported_count=imported_count,
+        imported_count=len(rows),
         skipped_count=skipped_count,
     )
 
 
 @router.get("/stories", response_model=list[schemas.StoryResponse])
-def list_stories(db: Session = Depends(get_db)):
-    return db.query(models.Story).all()
+async def list_stories(
+    response: Response,
+    workspace_id: int | None = None,
+    feature_id: uuid.UUID | None = None,
+    status: str | None = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    query = select(models.Story)
+    if workspace_id is not None:
+        query = query.where(models.Story.workspace_id == workspace_id)
+    if feature_id is not None:
+        query = query.where(models.Story.feature_id == feature_id)
+    if status is not None:
+        if status not in {"todo", "doing", "done"}:
+            raise HTTPException(status_code=400, detail="Invalid status. Use todo, doing, or done.")
+        query = query.where(models.Story.status == models.StoryStatus(status))
+    return await paginate(db, query, page, response, (models.Story.created_at, models.Story.id))
+
+
+@router.get("/board", response_model=schemas.BoardResponse)
+async def get_board(
+    product_id: int,
+    status: str | None = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """A product's stories grouped by status, with per-column totals computed in SQL.
+
+    Each column holds one page of stories; pass `status` with the column's
+    `next_cursor` as `cursor` to load the rest of a single column. `features`
+    holds only the features of the stories returned. Stories without a feature
+    are not on the board.
+    """
+    statuses = [status] if status is not None else [item.value for item in models.StoryStatus]
+    if any(item not in {"todo", "doing", "done"} for item in statuses):
+        raise HTTPException(status_code=400, detail="Invalid status. Use todo, doing, or done.")
+    if page.cursor and status is None:
+        raise HTTPException(status_code=400, detail="cursor requires status")
+
+    stories_query = (
+        select(models.Story)
+        .join(models.Feature, models.Story.feature_id == models.Feature.id)
+        .where(models.Feature.product_id == product_id)
+    )
+    totals_query = (
+        select(
+            models.Story.status,
+            func.count(models.Story.id),
+            func.coalesce(func.sum(models.Story.estimate), 0),
+        )
+        .join(models.Feature, models.Story.feature_id == models.Feature.id)
+        .where(models.Feature.product_id == product_id)
+    )
+
+    totals_result = await db.execute(
+        totals_query.where(models.Story.status.in_([models.StoryStatus(item) for item in statuses])).group_by(
+            models.Story.status
+        )
+    )
+    totals = {row_status.value: (count, estimate_total) for row_status, count, estimate_total in totals_result}
+
+    columns: list[schemas.BoardColumnResponse] = []
+    feature_ids = set()
+    for column_status in statuses:
+        stories, next_cursor = await fetch_page(
+            db,
+            stories_query.where(models.Story.status == models.StoryStatus(column_status)),
+            page,
+            (models.Story.created_at, models.Story.id),
+        )
+        feature_ids.update(story.feature_id for story in stories)
+        count, estimate_total = totals.get(column_status, (0, 0))
+        columns.append(
+            schemas.BoardColumnResponse(
+                status=column_status,
+                count=count,
+                estimate_total=estimate_total,
+                stories=[schemas.StoryResponse.model_validate(story) for story in stories],
+                next_cursor=next_cursor,
+            )
+        )
+
+    features = []
+    if feature_ids:
+        features_result = await db.execute(
+            select(models.Feature).where(models.Feature.id.in_(feature_ids)).order_by(models.Feature.title.asc())
+        )
+        features = features_result.scalars().all()
+    return schemas.BoardResponse(
+        product_id=product_id,
+        features=[schemas.FeatureResponse.model_validate(feature) for feature in features],
+        columns=columns,
+    )
 
 
 @router.post("/stories", response_model=schemas.StoryResponse)
@@ -65,6 +65,20 @@ class StoryResponse(StoryCreate):
         from_attributes = True
 
 
+class BoardColumnResponse(BaseModel):
+    status: str
+    count: int
+    estimate_total: int
+    stories: list[StoryResponse]
+    next_cursor: Optional[str] = None
+
+
+class BoardResponse(BaseModel):
+    product_id: int
+    features: list[FeatureResponse]
+    columns: list[BoardColumnResponse]
+
+
 class StoryUpdate(BaseModel):
     feature_id: Optional[UUID] = None
     workspace_id: Optional[int] = None
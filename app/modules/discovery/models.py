@@ -1,10 +1,11 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Enum, Integer, JSON
+from sqlalchemy import Column, DateTime, String, Text, ForeignKey, Enum, Integer, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 import uuid
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class ProblemStatus(str, enum.Enum):
@@ -17,10 +18,12 @@ class Problem(Base):
     __tablename__ = "problems"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    workspace_id = Column(Integer, ForeignKey("workspaces.id"))
+    workspace_id = Column(Integer, ForeignKey("workspaces.id"), index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     status = Column(Enum(ProblemStatus), default=ProblemStatus.open)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow)
 
     personas = relationship("Persona", back_populates="problem")
 
@@ -29,11 +32,13 @@ class Persona(Base):
     __tablename__ = "personas"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    problem_id = Column(UUID(as_uuid=True), ForeignKey("problems.id"))
+    problem_id = Column(UUID(as_uuid=True), ForeignKey("problems.id"), index=True)
     name = Column(String(100), nullable=False)
     context = Column(Text)
     goal = Column(Text)
     main_pain = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow)
 
     problem = relationship("Problem", back_populates="personas")
     journeys = relationship("UserJourney", back_populates="persona", cascade="all, delete-orphan")
@@ -43,9 +48,10 @@ class UserJourney(Base):
     __tablename__ = "user_journeys"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    persona_id = Column(UUID(as_uuid=True), ForeignKey("personas.id"), nullable=False)
-    name = Column(String(255), nullable=False)
+    persona_id = Column(UUID(as_uuid=True), ForeignKey("personas.id"), nullable=False, index=True)
+    name = Column(String(255), nullable=False, index=True)
     stages = Column(JSON, nullable=False, default=list)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow)
 
     persona = relationship("Persona", back_populates="journeys")
 
@@ -54,6 +60,7 @@ class ProductOKR(Base):
     __tablename__ = "product_okrs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    product_id = Column(Integer, ForeignKey("workspace_products.id"), nullable=False)
+    product_id = Column(Integer, ForeignKey("workspace_products.id"), nullable=False, index=True)
     objective = Column(Text, nullable=False)
     key_results = Column(JSON, nullable=False, default=list)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow)
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
+from app.core.etag import compute_etag, conditional_response
+from app.core.pagination import PageParams, paginate
+from app.core.profiling import ProfiledRoute
 from app.modules.discovery import models, schemas
-from app.modules.workspace.models import ProductBlueprint, Workspace, WorkspaceProduct
-import uuid
+from app.modules.workspace.models import Workspace, WorkspaceProduct
 
-router = APIRouter(prefix="/discovery", tags=["Discovery"])
+router = APIRouter(prefix="/discovery", tags=["Discovery"], route_class=ProfiledRoute)
 
 
 def _first_workspace_id(db: Session) -> int | None:
@@ -29,9 +35,17 @@ def _first_product_id(db: Session) -> int | None:
     product = db.query(WorkspaceProduct).order_by(WorkspaceProduct.id.asc()).first()
     return product.id if product else None
 
-@router.get("/problems")
-def list_problems(db: Session = Depends(get_db)):
-    return db.query(models.Problem).all()
+@router.get("/problems", response_model=list[schemas.ProblemResponse])
+async def list_problems(
+    response: Response,
+    workspace_id: int | None = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    query = select(models.Problem)
+    if workspace_id is not None:
+        query = query.where(models.Problem.workspace_id == workspace_id)
+    return await paginate(db, query, page, response, (models.Problem.created_at, models.Problem.id))
 
 @router.post("/problems", response_model=schemas.ProblemResponse)
 def create_problem(data: schemas.ProblemCreate, db: Session = Depends(get_db)):
@@ -60,15 +74,22 @@ def create_problem(data: schemas.ProblemCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/problems/{problem_id}", response_model=schemas.ProblemResponse)
-def get_problem(problem_id: str, db: Session = Depends(get_db)):
-    problem = db.query(models.Problem).filter(models.Problem.id == problem_id).first()
+async def get_problem(
+    problem_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    result = await db.execute(select(models.Problem).where(models.Problem.id == problem_id))
+    problem = result.scalars().first()
     if not problem:
         raise HTTPException(status_code=404, detail="Problem not found")
-    return problem
+    etag = compute_etag("problem", problem.id, problem.updated_at)
+    return conditional_response(request, response, etag) or problem
 
 
 @router.put("/problems/{problem_id}", response_model=schemas.ProblemResponse)
-def update_problem(problem_id: str, data: schemas.ProblemUpdate, db: Session = Depends(get_db)):
+def update_problem(problem_id: uuid.UUID, data: schemas.ProblemUpdate, db: Session = Depends(get_db)):
     problem = db.query(models.Problem).filter(models.Problem.id == problem_id).first()
     if not problem:
         raise HTTPException(status_code=404, detail="Problem not found")
@@ -99,7 +120,7 @@ def update_problem(problem_id: str, data: schemas.ProblemUpdate, db: Session = D
 
 
 @router.delete("/problems/{problem_id}", status_code=204)
-def delete_problem(problem_id: str, db: Session = Depends(get_db)):
+def delete_problem(problem_id: uuid.UUID, db: Session = Depends(get_db)):
     problem = db.query(models.Problem).filter(models.Problem.id == problem_id).first()
     if not problem:
         raise HTTPException(status_code=404, detail="Problem not found")
@@ -117,8 +138,18 @@ def delete_problem(problem_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/personas", response_model=list[schemas.PersonaResponse])
-def list_personas(db: Session = Depends(get_db)):
-    return db.query(models.Persona).all()
+async def list_personas(
+    response: Response,
+    workspace_id: int | None = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    query = select(models.Persona)
+    if workspace_id is not None:
+        query = query.join(models.Problem, models.Persona.problem_id == models.Problem.id).where(
+            models.Problem.workspace_id == workspace_id
+        )
+    return await paginate(db, query, page, response, (models.Persona.created_at, models.Persona.id))
 
 
 @router.post("/personas", response_model=schemas.PersonaResponse)
@@ -141,15 +172,22 @@ def create_persona(data: schemas.PersonaCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/personas/{persona_id}", response_model=schemas.PersonaResponse)
-def get_persona(persona_id: str, db: Session = Depends(get_db)):
-    persona = db.query(models.Persona).filter(models.Persona.id == persona_id).first()
+async def get_persona(
+    persona_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    result = await db.execute(select(models.Persona).where(models.Persona.id == persona_id))
+    persona = result.scalars().first()
     if not persona:
         raise HTTPException(status_code=404, detail="Persona not found")
-    return persona
+    etag = compute_etag("persona", persona.id, persona.updated_at)
+    return conditional_response(request, response, etag) or persona
 
 
 @router.put("/personas/{persona_id}", response_model=schemas.PersonaResponse)
-def update_persona(persona_id: str, data: schemas.PersonaUpdate, db: Session = Depends(get_db)):
+def update_persona(persona_id: uuid.UUID, data: schemas.PersonaUpdate, db: Session = Depends(get_db)):
     persona = db.query(models.Persona).filter(models.Persona.id == persona_id).first()
     if not persona:
         raise HTTPException(status_code=404, detail="Persona not found")
@@ -180,7 +218,7 @@ def update_persona(persona_id: str, data: schemas.PersonaUpdate, db: Session = D
 
 
 @router.delete("/personas/{persona_id}", status_code=204)
-def delete_persona(persona_id: str, db: Session = Depends(get_db)):
+def delete_persona(persona_id: uuid.UUID, db: Session = Depends(get_db)):
     persona = db.query(models.Persona).filter(models.Persona.id == persona_id).first()
     if not persona:
         raise HTTPException(status_code=404, detail="Persona not found")
@@ -190,48 +228,20 @@ def delete_persona(persona_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/journeys", response_model=list[schemas.UserJourneyResponse])
-def list_journeys(db: Session = Depends(get_db)):
-    # Backfill old published products:
-    # if blueprint has journeys and discovery table still misses them, create once.
-    existing = db.query(models.UserJourney).all()
-    existing_pairs = {(str(item.persona_id), item.name.strip().lower()) for item in existing}
-    valid_persona_ids = {str(persona.id) for persona in db.query(models.Persona).all()}
-
-    blueprints = db.query(ProductBlueprint).filter(ProductBlueprint.journeys.isnot(None)).all()
-    created_any = False
-    for blueprint in blueprints:
-        raw_journeys = blueprint.journeys or []
-        for journey in raw_journeys:
-            persona_id = str(journey.get("persona_id") or "").strip()
-            name = str(journey.get("name") or "").strip()
-            if not persona_id or not name or persona_id not in valid_persona_ids:
-                continue
-            pair = (persona_id, name.lower())
-            if pair in existing_pairs:
-                continue
-            raw_stages = journey.get("stages") or []
-            stages: list[str] = []
-            for stage in raw_stages:
-                if isinstance(stage, dict):
-                    text = str(stage.get("stage") or "").strip()
-                else:
-                    text = str(stage).strip()
-                if text:
-                    stages.append(text)
-            db.add(
-                models.UserJourney(
-                    persona_id=uuid.UUID(persona_id),
-                    name=name,
-                    stages=stages,
-                )
-            )
-            existing_pairs.add(pair)
-            created_any = True
-
-    if created_any:
-        db.commit()
-
-    return db.query(models.UserJourney).order_by(models.UserJourney.name.asc()).all()
+async def list_journeys(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    # Journeys of products published before the Discovery mirror are
+    # backfilled once by `python -m app.backfill journeys`.
+    return await paginate(
+        db,
+        select(models.UserJourney),
+        page,
+        response,
+        (models.UserJourney.name, models.UserJourney.id),
+    )
 
 
 @router.post("/journeys", response_model=schemas.UserJourneyResponse)
@@ -261,15 +271,22 @@ def create_journey(data: schemas.UserJourneyCreate, db: Session = Depends(get_db
 
 
 @router.get("/journeys/{journey_id}", response_model=schemas.UserJourneyResponse)
-def get_journey(journey_id: str, db: Session = Depends(get_db)):
-    journey = db.query(models.UserJourney).filter(models.UserJourney.id == journey_id).first()
+async def get_journey(
+    journey_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    result = await db.execute(select(models.UserJourney).where(models.UserJourney.id == journey_id))
+    journey = result.scalars().first()
     if not journey:
         raise HTTPException(status_code=404, detail="Journey not found")
-    return journey
+    etag = compute_etag("journey", journey.id, journey.updated_at)
+    return conditional_response(request, response, etag) or journey
 
 
 @router.put("/journeys/{journey_id}", response_model=schemas.UserJourneyResponse)
-def update_journey(journey_id: str, data: schemas.UserJourneyUpdate, db: Session = Depends(get_db)):
+def update_journey(journey_id: uuid.UUID, data: schemas.UserJourneyUpdate, db: Session = Depends(get_db)):
     journey = db.query(models.UserJourney).filter(models.UserJourney.id == journey_id).first()
     if not journey:
         raise HTTPException(status_code=404, detail="Journey not found")
@@ -300,7 +317,7 @@ def update_journey(journey_id: str, data: schemas.UserJourneyUpdate, db: Session
 
 
 @router.delete("/journeys/{journey_id}", status_code=204)
-def delete_journey(journey_id: str, db: Session = Depends(get_db)):
+def delete_journey(journey_id: uuid.UUID, db: Session = Depends(get_db)):
     journey = db.query(models.UserJourney).filter(models.UserJourney.id == journey_id).first()
     if not journey:
         raise HTTPException(status_code=404, detail="Journey not found")
@@ -310,60 +327,24 @@ def delete_journey(journey_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/okrs", response_model=list[schemas.ProductOKRResponse])
-def list_okrs(product_id: int | None = None, db: Session = Depends(get_db)):
-    query = db.query(models.ProductOKR)
+async def list_okrs(
+    response: Response,
+    product_id: int | None = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    # Blueprint objectives are reconciled into OKRs at publish time, and for
+    # older products by `python -m app.backfill okrs`.
+    query = select(models.ProductOKR)
     if product_id is not None:
-        query = query.filter(models.ProductOKR.product_id == product_id)
-
-        # Backfill old published products from Lean Inception blueprint metrics.
-        existing = query.all()
-        existing_keys = {
-            (item.product_id, item.objective.strip().lower())
-            for item in existing
-        }
-        blueprints = (
-            db.query(ProductBlueprint)
-            .filter(ProductBlueprint.product_id == product_id)
-            .all()
-        )
-        created_any = False
-        for blueprint in blueprints:
-            metrics = blueprint.metrics or {}
-            objectives = metrics.get("objectives") or []
-            if not objectives and metrics.get("objective"):
-                objectives = [
-                    {
-                        "objective": metrics.get("objective"),
-                        "key_results": metrics.get("key_results") or [],
-                    }
-                ]
-            for objective_item in objectives:
-                objective_text = str(objective_item.get("objective") or "").strip()
-                if not objective_text:
-                    continue
-                key = (blueprint.product_id, objective_text.lower())
-                if key in existing_keys:
-                    continue
-                key_results = objective_item.get("key_results") or []
-                db.add(
-                    models.ProductOKR(
-                        product_id=blueprint.product_id,
-                        objective=objective_text,
-                        key_results=[str(kr).strip() for kr in key_results if str(kr).strip()],
-                    )
-                )
-                existing_keys.add(key)
-                created_any = True
-        if created_any:
-            db.commit()
-        return (
-            db.query(models.ProductOKR)
-            .filter(models.ProductOKR.product_id == product_id)
-            .order_by(models.ProductOKR.objective.asc())
-            .all()
-        )
-
-    return query.order_by(models.ProductOKR.objective.asc()).all()
+        query = query.where(models.ProductOKR.product_id == product_id)
+    return await paginate(
+        db,
+        query,
+        page,
+        response,
+        (models.ProductOKR.objective, models.ProductOKR.id),
+    )
 
 
 @router.post("/okrs", response_model=schemas.ProductOKRResponse)
@@ -393,15 +374,22 @@ def create_okr(data: schemas.ProductOKRCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/okrs/{okr_id}", response_model=schemas.ProductOKRResponse)
-def get_okr(okr_id: str, db: Session = Depends(get_db)):
-    okr = db.query(models.ProductOKR).filter(models.ProductOKR.id == okr_id).first()
+async def get_okr(
+    okr_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    result = await db.execute(select(models.ProductOKR).where(models.ProductOKR.id == okr_id))
+    okr = result.scalars().first()
     if not okr:
         raise HTTPException(status_code=404, detail="OKR not found")
-    return okr
+    etag = compute_etag("okr", okr.id, okr.updated_at)
+    return conditional_response(request, response, etag) or okr
 
 
 @router.put("/okrs/{okr_id}", response_model=schemas.ProductOKRResponse)
-def update_okr(okr_id: str, data: schemas.ProductOKRUpdate, db: Session = Depends(get_db)):
+def update_okr(okr_id: uuid.UUID, data: schemas.ProductOKRUpdate, db: Session = Depends(get_db)):
     okr = db.query(models.ProductOKR).filter(models.ProductOKR.id == okr_id).first()
     if not okr:
         raise HTTPException(status_code=404, detail="OKR not found")
@@ -431,7 +419,7 @@ def update_okr(okr_id: str, data: schemas.ProductOKRUpdate, db: Session = Depend
 
 
 @router.delete("/okrs/{okr_id}", status_code=204)
-def delete_okr(okr_id: str, db: Session = Depends(get_db)):
+def delete_okr(okr_id: uuid.UUID, db: Session = Depends(get_db)):
     okr = db.query(models.ProductOKR).filter(models.ProductOKR.id == okr_id).first()
     if not okr:
         raise HTTPException(status_code=404, detail="OKR not found")
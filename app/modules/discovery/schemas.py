@@ -11,6 +11,7 @@ class ProblemCreate(BaseModel):
 
 class ProblemResponse(ProblemCreate):
     id: UUID
+    workspace_id: Optional[int]
     status: str
 
     class Config:
@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+import uuid
+
+from app.modules.discovery import models
+from app.modules.workspace.models import ProductBlueprint
+
+
+def normalize_journey_stages(raw_stages) -> list[str]:
+    """Flatten Lean Inception journey stages (strings or {"stage": ...}) into text."""
+    stages: list[str] = []
+    for stage in raw_stages or []:
+        if isinstance(stage, dict):
+            text = str(stage.get("stage") or "").strip()
+        else:
+            text = str(stage).strip()
+        if text:
+            stages.append(text)
+    return stages
+
+
+def clean_key_results(key_results) -> list[str]:
+    return [str(kr).strip() for kr in key_results or [] if str(kr).strip()]
+
+
+def metric_objectives(metrics: dict | None) -> list[dict]:
+    """Objectives of a product_metrics payload, accepting the legacy single-objective shape."""
+    metrics = metrics or {}
+    objectives = metrics.get("objectives") or []
+    if not objectives and metrics.get("objective"):
+        objectives = [
+            {
+                "objective": metrics.get("objective"),
+                "key_results": metrics.get("key_results") or [],
+            }
+        ]
+    return objectives
+
+
+def reconcile_blueprint_okrs(db: Session, blueprint: ProductBlueprint) -> int:
+    """Create ProductOKR rows for blueprint objectives missing on its product.
+
+    Marks the blueprint as backfilled so it is not reconciled again.
+    """
+    existing_objectives = {
+        objective.strip().lower()
+        for objective in db.scalars(
+            select(models.ProductOKR.objective).where(models.ProductOKR.product_id == blueprint.product_id)
+        )
+    }
+    created = 0
+    for objective_item in metric_objectives(blueprint.metrics):
+        objective_text = str(objective_item.get("objective") or "").strip()
+        if not objective_text or objective_text.lower() in existing_objectives:
+            continue
+        db.add(
+            models.ProductOKR(
+                product_id=blueprint.product_id,
+                objective=objective_text,
+                key_results=clean_key_results(objective_item.get("key_results")),
+            )
+        )
+        existing_objectives.add(objective_text.lower())
+        created += 1
+    blueprint.backfilled_at = datetime.now(timezone.utc)
+    return created
+
+
+def backfill_blueprint_okrs(db: Session) -> int:
+    """Reconcile OKRs of every blueprint that has not been backfilled yet."""
+    blueprints = db.scalars(select(ProductBlueprint).where(ProductBlueprint.backfilled_at.is_(None))).all()
+    created = sum(reconcile_blueprint_okrs(db, blueprint) for blueprint in blueprints)
+    db.flush()
+    return created
+
+
+def backfill_blueprint_journeys(db: Session) -> int:
+    """Mirror journeys of products published before the Discovery mirror existed.
+
+    Idempotent: a journey already present for the same persona and name is skipped.
+    """
+    existing_pairs = {
+        (str(persona_id), name.strip().lower())
+        for persona_id, name in db.execute(select(models.UserJourney.persona_id, models.UserJourney.name))
+    }
+    valid_persona_ids = {str(persona_id) for persona_id in db.scalars(select(models.Persona.id))}
+
+    created = 0
+    blueprint_journeys = db.scalars(
+        select(ProductBlueprint.journeys).where(ProductBlueprint.journeys.isnot(None))
+    )
+    for raw_journeys in blueprint_journeys:
+        for journey in raw_journeys or []:
+            persona_id = str(journey.get("persona_id") or "").strip()
+            name = str(journey.get("name") or "").strip()
+            if not persona_id or not name or persona_id not in valid_persona_ids:
+                continue
+            pair = (persona_id, name.lower())
+            if pair in existing_pairs:
+                continue
+            db.add(
+                models.UserJourney(
+                    persona_id=uuid.UUID(persona_id),
+                    name=name,
+                    stages=normalize_journey_stages(journey.get("stages")),
+                )
+            )
+            existing_pairs.add(pair)
+            created += 1
+    db.flush()
+    return created
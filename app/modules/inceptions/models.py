@@ -1,23 +1,23 @@
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class Inception(Base):
     __tablename__ = "inceptions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    workspace_id = Column(ForeignKey("workspaces.id"), nullable=False)
+    workspace_id = Column(ForeignKey("workspaces.id"), nullable=False, index=True)
     type = Column(String(50), nullable=False)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     status = Column(String(50), default="active")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow)
 
     steps = relationship("InceptionStep", back_populates="inception", cascade="all, delete-orphan")
 
@@ -33,6 +33,26 @@ class InceptionStep(Base):
     step_key = Column(String(100), nullable=False)
     payload = Column(JSONB, nullable=False, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow)
 
     inception = relationship("Inception", back_populates="steps")
+
+
+class PublishJob(Base):
+    """Background publish-product run; one per inception so retries are idempotent."""
+
+    __tablename__ = "inception_publish_jobs"
+    __table_args__ = (
+        UniqueConstraint("inception_id", name="uq_inception_publish_jobs_inception_id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    inception_id = Column(UUID(as_uuid=True), ForeignKey("inceptions.id"), nullable=False)
+    status = Column(String(20), nullable=False, default="queued")
+    name = Column(String(255))
+    product_id = Column(Integer, ForeignKey("workspace_products.id"))
+    blueprint_id = Column(Integer, ForeignKey("product_blueprints.id"))
+    error = Column(Text)
+    started_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow)
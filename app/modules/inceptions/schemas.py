@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel
 from typing import Any, Optional
 from uuid import UUID
@@ -45,3 +46,16 @@ class InceptionPublishProductResponse(BaseModel):
     workspace_id: int
     name: str
     blueprint_id: int
+
+
+class InceptionPublishJobResponse(BaseModel):
+    id: UUID
+    inception_id: UUID
+    status: str
+    product_id: int | None = None
+    blueprint_id: int | None = None
+    error: str | None = None
+    started_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
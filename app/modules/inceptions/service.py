@@ -0,0 +1,358 @@
+from datetime import datetime, timezone
+from fastapi import HTTPException
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+import logging
+import uuid
+
+from app.core.config import settings
+from app.core.database import SessionLocal, utcnow
+from app.modules.inceptions import models, schemas
+from app.modules.workspace.models import ProductBlueprint, WorkspaceProduct
+from app.modules.discovery.models import Persona, ProductOKR, UserJourney
+from app.modules.discovery.service import clean_key_results, metric_objectives, normalize_journey_stages
+from app.modules.workspace.service import boundaries_from_payload
+
+logger = logging.getLogger(__name__)
+
+
+def _build_product_vision_summary(product_vision: dict) -> str:
+    target_audience = (product_vision.get("target_audience") or "").strip()
+    product_name = (product_vision.get("product_name") or "").strip()
+    problem_statement = (product_vision.get("problem_statement") or "").strip()
+    product_category = (product_vision.get("product_category") or "").strip()
+    key_benefit = (product_vision.get("key_benefit") or "").strip()
+    alternatives = (product_vision.get("alternatives") or "").strip()
+    differential = (product_vision.get("differential") or "").strip()
+
+    base_parts: list[str] = []
+    if target_audience:
+        base_parts.append(f"Para {target_audience}")
+    if product_name:
+        base_parts.append(f"o {product_name}")
+    if problem_statement:
+        base_parts.append(f"resolve {problem_statement}")
+    if product_category:
+        base_parts.append(f"como {product_category}")
+    if key_benefit:
+        base_parts.append(f"trazendo {key_benefit}")
+
+    summary = ", ".join(base_parts)
+    if summary:
+        summary += "."
+
+    if alternatives and differential:
+        summary += f" Diferentemente de {alternatives}, o nosso produto {differential}."
+    elif alternatives:
+        summary += f" Diferentemente de {alternatives}."
+    elif differential:
+        summary += f" O nosso diferencial e {differential}."
+    return summary.strip()
+
+
+def publish_product(
+    db: Session,
+    inception: models.Inception,
+    name: str | None,
+) -> schemas.InceptionPublishProductResponse:
+    """Create the product, blueprint, OKRs and mirrored journeys of an inception.
+
+    Archives the inception; the caller owns the transaction and commits.
+    """
+    steps = (
+        db.query(models.InceptionStep)
+        .filter(models.InceptionStep.inception_id == inception.id)
+        .all()
+    )
+    step_map: dict[str, dict] = {step.step_key: step.payload or {} for step in steps}
+
+    product_vision_payload = step_map.get("product_vision", {})
+    personas_payload = step_map.get("personas", {})
+    journeys_payload = step_map.get("journey_map", {})
+    metrics_payload = step_map.get("product_metrics", {})
+    boundaries_payload = step_map.get("boundaries", {})
+    feature_review_payload = step_map.get("feature_review", {})
+    expected_result_payload = step_map.get("expected_result", {})
+    cost_timeline_payload = step_map.get("cost_timeline", {})
+
+    product_name = (name or product_vision_payload.get("product_name") or inception.title or "").strip()
+    if not product_name:
+        raise HTTPException(status_code=400, detail="Product name is required to publish")
+
+    vision_summary = _build_product_vision_summary(product_vision_payload)
+    product = WorkspaceProduct(
+        workspace_id=inception.workspace_id,
+        name=product_name,
+        description=vision_summary or inception.description,
+        status="active",
+    )
+    db.add(product)
+    db.flush()
+
+    persona_ids: list[str] = personas_payload.get("persona_ids") or []
+    valid_persona_ids: list[uuid.UUID] = []
+    for persona_id in persona_ids:
+        try:
+            valid_persona_ids.append(uuid.UUID(str(persona_id)))
+        except ValueError:
+            continue
+    personas = (
+        db.query(Persona)
+        .filter(Persona.id.in_(valid_persona_ids))
+        .all()
+        if valid_persona_ids
+        else []
+    )
+    personas_snapshot = [
+        {
+            "id": str(persona.id),
+            "name": persona.name,
+            "context": persona.context,
+            "goal": persona.goal,
+            "main_pain": persona.main_pain,
+        }
+        for persona in personas
+    ]
+
+    journeys_snapshot = journeys_payload.get("journeys") or []
+    if not journeys_snapshot and journeys_payload.get("stages"):
+        journeys_snapshot = [
+            {
+                "name": "Jornada principal",
+                "persona_id": None,
+                "stages": journeys_payload.get("stages", []),
+            }
+        ]
+
+    features_snapshot = feature_review_payload.get("features") or []
+    sequencing_snapshot = (feature_review_payload.get("sequencing") or {})
+    roadmap_snapshot = {
+        "sequencing": sequencing_snapshot,
+        "waves": cost_timeline_payload.get("waves") or [],
+    }
+
+    blueprint = ProductBlueprint(
+        product_id=product.id,
+        source_inception_id=inception.id,
+        vision=vision_summary,
+        boundaries=boundaries_from_payload(boundaries_payload),
+        personas=personas_snapshot,
+        journeys=journeys_snapshot,
+        metrics={
+            "objectives": metrics_payload.get("objectives") or [],
+            "text": metrics_payload.get("text"),
+        },
+        features=features_snapshot,
+        roadmap=roadmap_snapshot,
+        expected_result=expected_result_payload.get("text"),
+        cost_timeline={
+            "total_cost": cost_timeline_payload.get("total_cost"),
+            "waves": cost_timeline_payload.get("waves") or [],
+            "text": cost_timeline_payload.get("text"),
+        },
+        backfilled_at=datetime.now(timezone.utc),
+    )
+    db.add(blueprint)
+    db.flush()
+
+    okr_rows = []
+    for objective_item in metric_objectives(metrics_payload):
+        objective_text = str(objective_item.get("objective") or "").strip()
+        if not objective_text:
+            continue
+        okr_rows.append(
+            {
+                "id": uuid.uuid4(),
+                "product_id": product.id,
+                "objective": objective_text,
+                "key_results": clean_key_results(objective_item.get("key_results")),
+            }
+        )
+    if okr_rows:
+        db.execute(insert(ProductOKR).values(okr_rows))
+
+    # Mirror journeys into Discovery module so they are editable there after publish.
+    journey_rows = []
+    persona_ids_by_str = {str(persona.id): persona.id for persona in personas}
+    if journeys_snapshot and persona_ids_by_str:
+        existing_pairs = {
+            (persona_id, name)
+            for persona_id, name in db.execute(
+                select(UserJourney.persona_id, UserJourney.name).where(
+                    UserJourney.persona_id.in_(list(persona_ids_by_str.values()))
+                )
+            )
+        }
+        for journey in journeys_snapshot:
+            persona_id = persona_ids_by_str.get(str(journey.get("persona_id") or ""))
+            journey_name = (journey.get("name") or "").strip()
+            if persona_id is None or not journey_name or (persona_id, journey_name) in existing_pairs:
+                continue
+            existing_pairs.add((persona_id, journey_name))
+            journey_rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "persona_id": persona_id,
+                    "name": journey_name,
+                    "stages": normalize_journey_stages(journey.get("stages")),
+                }
+            )
+    if journey_rows:
+        db.execute(insert(UserJourney).values(journey_rows))
+
+    inception.status = "archived"
+    return schemas.InceptionPublishProductResponse(
+        product_id=product.id,
+        workspace_id=product.workspace_id,
+        name=product.name,
+        blueprint_id=blueprint.id,
+    )
+
+
+class PublishError(Exception):
+    """An inception cannot be published; the message is safe to show to users."""
+
+
+class PublishConflict(PublishError):
+    """The inception is already archived or another publish of it is in progress."""
+
+
+ACTIVE_JOB_STATUSES = ("queued", "running")
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes for timezone-aware columns.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _is_restartable(job: models.PublishJob) -> bool:
+    """Failed jobs, and queued/running jobs whose worker is presumed dead."""
+    if job.status == "failed":
+        return True
+    if job.status not in ACTIVE_JOB_STATUSES:
+        return False
+    last_activity = job.started_at if job.status == "running" else job.updated_at or job.created_at
+    if last_activity is None:
+        return False
+    age = (utcnow() - _as_utc(last_activity)).total_seconds()
+    return age >= settings.publish_job_stale_seconds
+
+
+def _get_publish_job(db: Session, inception_id: uuid.UUID) -> models.PublishJob | None:
+    return db.scalars(select(models.PublishJob).where(models.PublishJob.inception_id == inception_id)).first()
+
+
+def enqueue_publish_job(db: Session, inception: models.Inception, name: str | None) -> tuple[models.PublishJob, bool]:
+    """Return the publish job of an inception, creating or re-queueing it when needed.
+
+    The second element tells whether the job must be (re)started. Failed and stale
+    jobs are re-queued; active or succeeded jobs are returned as they are.
+    """
+    job = _get_publish_job(db, inception.id)
+    if job is not None and not _is_restartable(job):
+        return job, False
+    if inception.status == "archived":
+        raise PublishConflict("Inception already archived")
+    if job is None:
+        job = models.PublishJob(inception_id=inception.id, status="queued", name=name)
+        db.add(job)
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent request created the job first.
+            db.rollback()
+            return _get_publish_job(db, inception.id), False
+        return job, True
+    job.status = "queued"
+    job.name = name
+    job.error = None
+    job.started_at = None
+    db.commit()
+    return job, True
+
+
+def _claim_for_sync_publish(db: Session, inception: models.Inception, name: str | None) -> models.PublishJob:
+    """Mark the inception's publish job as running in the caller's transaction.
+
+    Sync and async publishes share the one-job-per-inception row, so they
+    exclude each other: the row stays locked until the caller commits.
+    """
+    job = _get_publish_job(db, inception.id)
+    if job is None:
+        job = models.PublishJob(inception_id=inception.id, status="running", name=name, started_at=utcnow())
+        db.add(job)
+        try:
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            raise PublishConflict("Inception is already being published")
+        return job
+    if not _is_restartable(job):
+        if job.status in ACTIVE_JOB_STATUSES:
+            raise PublishConflict("Inception is already being published")
+        raise PublishConflict("Inception already archived")
+    claimed = db.execute(
+        update(models.PublishJob)
+        .where(models.PublishJob.id == job.id, models.PublishJob.status == job.status)
+        .values(status="running", name=name, error=None, started_at=utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if claimed.rowcount != 1:
+        raise PublishConflict("Inception is already being published")
+    db.refresh(job)
+    return job
+
+
+def publish_now(db: Session, inception: models.Inception, name: str | None) -> schemas.InceptionPublishProductResponse:
+    """Publish synchronously, recording the run on the inception's publish job; the caller commits."""
+    if inception.status == "archived":
+        raise PublishConflict("Inception already archived")
+    job = _claim_for_sync_publish(db, inception, name)
+    result = publish_product(db, inception, name)
+    job.status = "succeeded"
+    job.product_id = result.product_id
+    job.blueprint_id = result.blueprint_id
+    return result
+
+
+def run_publish_job(job_id: uuid.UUID) -> None:
+    """Execute a queued publish job in its own session; meant for BackgroundTasks."""
+    with SessionLocal() as db:
+        # Claim the job atomically so a duplicate task cannot run it twice.
+        claimed = db.execute(
+            update(models.PublishJob)
+            .where(models.PublishJob.id == job_id, models.PublishJob.status == "queued")
+            .values(status="running", started_at=utcnow())
+        )
+        db.commit()
+        if claimed.rowcount != 1:
+            return
+        job = db.get(models.PublishJob, job_id)
+
+        try:
+            inception = db.get(models.Inception, job.inception_id)
+            if inception is None:
+                raise PublishError("Inception not found")
+            if inception.status == "archived":
+                raise PublishConflict("Inception already archived")
+            result = publish_product(db, inception, job.name)
+        except Exception as exc:
+            db.rollback()
+            if isinstance(exc, PublishError):
+                error = str(exc)
+            elif isinstance(exc, HTTPException):
+                error = exc.detail
+            else:
+                logger.exception("Publish job %s failed", job_id)
+                error = "Internal error"
+            job = db.get(models.PublishJob, job_id)
+            job.status = "failed"
+            job.error = error
+            db.commit()
+            return
+
+        job.status = "succeeded"
+        job.product_id = result.product_id
+        job.blueprint_id = result.blueprint_id
+        db.commit()
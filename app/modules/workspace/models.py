@@ -4,7 +4,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class Workspace(Base):
@@ -59,9 +59,11 @@ class ProductBlueprint(Base):
     roadmap: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     expected_result: Mapped[str | None] = mapped_column(Text, nullable=True)
     cost_timeline: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Set once metrics.objectives have been reconciled into product_okrs.
+    backfilled_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), server_default=func.now(), onupdate=utcnow, nullable=False
     )
 
     product = relationship("WorkspaceProduct", back_populates="blueprint")
@@ -1,10 +1,12 @@
 # app/modules/workspace/router.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.modules.inceptions.models import InceptionStep
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
+
+from app.core.database import get_async_db, get_db
+from app.core.etag import compute_etag, conditional_response
+from app.core.profiling import ProfiledRoute
 from app.modules.workspace.models import ProductBlueprint, Workspace, WorkspaceMember, WorkspaceProduct
 from app.modules.workspace.schemas import (
     WorkspaceCreate,
@@ -17,7 +19,7 @@ from app.modules.workspace.schemas import (
     WorkspaceResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["workspaces"])
+router = APIRouter(prefix="/workspaces", tags=["workspaces"], route_class=ProfiledRoute)
 
 
 @router.post("", response_model=WorkspaceResponse)
@@ -37,19 +39,20 @@ def create_workspace(data: WorkspaceCreate, db: Session = Depends(get_db)):
 
 
 @router.get("", response_model=list[WorkspaceResponse])
-def list_workspaces(user_id: int | None = None, db: Session = Depends(get_db)):
-    query = db.query(Workspace)
+async def list_workspaces(user_id: int | None = None, db: AsyncSession = Depends(get_async_db)):
+    query = select(Workspace)
     if user_id is not None:
         query = query.outerjoin(
             WorkspaceMember,
             WorkspaceMember.workspace_id == Workspace.id,
-        ).filter(
+        ).where(
             or_(
                 Workspace.owner_id == user_id,
                 WorkspaceMember.user_id == user_id,
             )
         )
-    return query.order_by(Workspace.id.asc()).all()
+    result = await db.execute(query.order_by(Workspace.id.asc()))
+    return result.scalars().all()
 
 
 @router.post("/{workspace_id}/members", response_model=WorkspaceMemberResponse)
@@ -77,16 +80,16 @@ def add_member(workspace_id: int, data: WorkspaceMemberAdd, db: Session = Depend
 
 
 @router.get("/{workspace_id}/members", response_model=list[WorkspaceMemberResponse])
-def list_members(workspace_id: int, db: Session = Depends(get_db)):
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+async def list_members(workspace_id: int, db: AsyncSession = Depends(get_async_db)):
+    workspace = await db.get(Workspace, workspace_id)
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
-    return (
-        db.query(WorkspaceMember)
-        .filter(WorkspaceMember.workspace_id == workspace_id)
+    result = await db.execute(
+        select(WorkspaceMember)
+        .where(WorkspaceMember.workspace_id == workspace_id)
         .order_by(WorkspaceMember.user_id.asc())
-        .all()
     )
+    return result.scalars().all()
 
 
 @router.post("/{workspace_id}/products", response_model=WorkspaceProductResponse)
@@ -108,66 +111,32 @@ def create_product(workspace_id: int, data: WorkspaceProductCreate, db: Session
 
 
 @router.get("/{workspace_id}/products", response_model=list[WorkspaceProductResponse])
-def list_products(workspace_id: int, db: Session = Depends(get_db)):
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+async def list_products(workspace_id: int, db: AsyncSession = Depends(get_async_db)):
+    workspace = await db.get(Workspace, workspace_id)
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
-    return (
-        db.query(WorkspaceProduct)
-        .filter(WorkspaceProduct.workspace_id == workspace_id)
+    result = await db.execute(
+        select(WorkspaceProduct)
+        .where(WorkspaceProduct.workspace_id == workspace_id)
         .order_by(WorkspaceProduct.id.asc())
-        .all()
     )
+    return result.scalars().all()
 
 
-@router.get("/{workspace_id}/products/{product_id}", response_model=WorkspaceProductDetailResponse)
-def get_product(workspace_id: int, product_id: int, db: Session = Depends(get_db)):
-    product = (
-        db.query(WorkspaceProduct)
-        .filter(
+def _product_with_blueprint_query(workspace_id: int, product_id: int):
+    return (
+        select(WorkspaceProduct, ProductBlueprint)
+        .outerjoin(ProductBlueprint, ProductBlueprint.product_id == WorkspaceProduct.id)
+        .where(
             WorkspaceProduct.workspace_id == workspace_id,
             WorkspaceProduct.id == product_id,
         )
-        .first()
     )
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
 
-    blueprint = (
-        db.query(ProductBlueprint)
-        .filter(ProductBlueprint.product_id == product.id)
-        .first()
-    )
-    vision = blueprint.vision if blueprint and blueprint.vision else product.description
-    boundaries = blueprint.boundaries if blueprint else None
-
-    # Backward compatibility:
-    # products published before boundaries support may have source inception
-    # but boundaries still null in blueprint. Recover from inception step.
-    if (
-        blueprint
-        and not boundaries
-        and blueprint.source_inception_id is not None
-    ):
-        boundaries_step = (
-            db.query(InceptionStep)
-            .filter(
-                InceptionStep.inception_id == blueprint.source_inception_id,
-                InceptionStep.step_key == "boundaries",
-            )
-            .first()
-        )
-        if boundaries_step and boundaries_step.payload:
-            recovered = {
-                "is": boundaries_step.payload.get("is") or [],
-                "is_not": boundaries_step.payload.get("is_not") or [],
-                "does": boundaries_step.payload.get("does") or [],
-                "does_not": boundaries_step.payload.get("does_not") or [],
-            }
-            blueprint.boundaries = recovered
-            db.commit()
-            boundaries = recovered
 
+def _product_detail(product: WorkspaceProduct, blueprint: ProductBlueprint | None) -> WorkspaceProductDetailResponse:
+    # Boundaries of products published before blueprints stored them are
+    # recovered once by `python -m app.backfill boundaries`.
     return WorkspaceProductDetailResponse(
         id=product.id,
         workspace_id=product.workspace_id,
@@ -175,23 +144,46 @@ def get_product(workspace_id: int, product_id: int, db: Session = Depends(get_db
         description=product.description,
         status=product.status,
         created_at=product.created_at,
-        vision=vision,
-        boundaries=boundaries,
+        vision=blueprint.vision if blueprint and blueprint.vision else product.description,
+        boundaries=blueprint.boundaries if blueprint else None,
     )
 
 
-@router.put("/{workspace_id}/products/{product_id}", response_model=WorkspaceProductDetailResponse)
-def update_product(workspace_id: int, product_id: int, data: WorkspaceProductUpdate, db: Session = Depends(get_db)):
-    product = (
-        db.query(WorkspaceProduct)
-        .filter(
-            WorkspaceProduct.workspace_id == workspace_id,
-            WorkspaceProduct.id == product_id,
+@router.get("/{workspace_id}/products/{product_id}", response_model=WorkspaceProductDetailResponse)
+async def get_product(
+    workspace_id: int,
+    product_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    # Only the blueprint columns the detail shows; features/journeys/roadmap stay in the database.
+    result = await db.execute(
+        _product_with_blueprint_query(workspace_id, product_id).options(
+            load_only(ProductBlueprint.vision, ProductBlueprint.boundaries, ProductBlueprint.updated_at)
         )
-        .first()
     )
-    if not product:
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=404, detail="Product not found")
+    product, blueprint = row
+    etag = compute_etag(
+        "product",
+        product.id,
+        product.name,
+        product.description,
+        product.status,
+        blueprint.updated_at if blueprint else None,
+    )
+    return conditional_response(request, response, etag) or _product_detail(product, blueprint)
+
+
+@router.put("/{workspace_id}/products/{product_id}", response_model=WorkspaceProductDetailResponse)
+def update_product(workspace_id: int, product_id: int, data: WorkspaceProductUpdate, db: Session = Depends(get_db)):
+    row = db.execute(_product_with_blueprint_query(workspace_id, product_id)).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Product not found")
+    product, blueprint = row
 
     if data.name is not None:
         name = data.name.strip()
@@ -199,39 +191,17 @@ def update_product(workspace_id: int, product_id: int, data: WorkspaceProductUpd
             raise HTTPException(status_code=400, detail="Product name cannot be empty")
         product.name = name
 
+    if (data.vision is not None or data.boundaries is not None) and not blueprint:
+        blueprint = ProductBlueprint(product_id=product.id, source_inception_id=None)
+        db.add(blueprint)
+
     if data.vision is not None:
         product.description = data.vision
-        blueprint = (
-            db.query(ProductBlueprint)
-            .filter(ProductBlueprint.product_id == product.id)
-            .first()
-        )
-        if blueprint:
-            blueprint.vision = data.vision
-        else:
-            blueprint = ProductBlueprint(
-                product_id=product.id,
-                vision=data.vision,
-                source_inception_id=None,
-            )
-            db.add(blueprint)
+        blueprint.vision = data.vision
 
     if data.boundaries is not None:
-        blueprint = (
-            db.query(ProductBlueprint)
-            .filter(ProductBlueprint.product_id == product.id)
-            .first()
-        )
-        if blueprint:
-            blueprint.boundaries = data.boundaries
-        else:
-            blueprint = ProductBlueprint(
-                product_id=product.id,
-                boundaries=data.boundaries,
-                source_inception_id=None,
-            )
-            db.add(blueprint)
+        blueprint.boundaries = data.boundaries
 
+    response = _product_detail(product, blueprint)
     db.commit()
-    db.refresh(product)
-    return get_product(workspace_id, product_id, db)
+    return response
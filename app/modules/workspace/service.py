@@ -0,0 +1,37 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.modules.inceptions.models import InceptionStep
+from app.modules.workspace.models import ProductBlueprint
+
+BOUNDARY_KEYS = ("is", "is_not", "does", "does_not")
+
+
+def boundaries_from_payload(payload: dict | None) -> dict:
+    payload = payload or {}
+    return {key: payload.get(key) or [] for key in BOUNDARY_KEYS}
+
+
+def backfill_blueprint_boundaries(db: Session) -> int:
+    """Recover boundaries of products published before blueprints stored them.
+
+    Copies the source inception's `boundaries` step into blueprints whose
+    boundaries are still empty; blueprints that already have them are untouched.
+    """
+    rows = db.execute(
+        select(ProductBlueprint, InceptionStep.payload)
+        .join(
+            InceptionStep,
+            (InceptionStep.inception_id == ProductBlueprint.source_inception_id)
+            & (InceptionStep.step_key == "boundaries"),
+        )
+        .where(ProductBlueprint.source_inception_id.isnot(None))
+    )
+    recovered = 0
+    for blueprint, payload in rows:
+        if blueprint.boundaries or not payload:
+            continue
+        blueprint.boundaries = boundaries_from_payload(payload)
+        recovered += 1
+    db.flush()
+    return recovered
@@ -0,0 +1,67 @@
+# app/startup_profile.py
+"""Report the import-time cost of the application, as measured by ``-X importtime``.
+
+The import runs in a fresh interpreter so nothing is cached in ``sys.modules``::
+
+    python -m app.startup_profile
+    python -m app.startup_profile --top 40 --budget-ms 800
+
+With ``--budget-ms`` the command exits with status 1 when the total exceeds
+the budget, so it can guard cold-start time in CI.
+"""
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+
+
+def measure_imports(module: str) -> list[tuple[str, int, int]]:
+    """Import `module` in a subprocess; returns (module, self_us, cumulative_us) in import order."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise SystemExit(completed.stderr)
+
+    records = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue  # header row
+        records.append((name, int(self_us), int(cumulative_us)))
+    return records
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main", help="module to import (default: app.main)")
+    parser.add_argument("--top", type=int, default=25, help="number of modules to list")
+    parser.add_argument("--budget-ms", type=float, help="fail when the total import time exceeds this")
+    args = parser.parse_args(argv)
+
+    records = measure_imports(args.module)
+    total_ms = next(cumulative for name, _, cumulative in records if name == args.module) / 1000
+
+    print(f"{args.module} imported in {total_ms:.1f} ms ({len(records)} modules)\n")
+    print(f"Top {args.top} modules by cumulative time:")
+    for name, self_us, cumulative_us in sorted(records, key=lambda record: record[2], reverse=True)[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:7.1f} ms self  {name}")
+
+    by_package: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in records:
+        by_package[name.split(".")[0]] += self_us
+    print("\nSelf time by top-level package:")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nImport time {total_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -98,7 +98,7 @@ export default function App() {
   }
   if (activeNav === "features") page = <FeaturesPage />;
   if (activeNav === "stories") page = <StoriesPage />;
-  if (activeNav === "board") page = <BoardPage />;
+  if (activeNav === "board") page = <BoardPage productId={selectedProduct.id} />;
   if (activeNav === "profile") page = <ProfilePage />;
   if (activeNav === "workspace") {
     page = (
@@ -1,9 +1,8 @@
 ﻿import { useEffect, useMemo, useState } from "react";
 import { PageHeader } from "../../discovery/components/PageHeader";
 import { EmptyState } from "../../discovery/components/EmptyState";
-import { listFeatures, listStories, updateStory } from "../services/deliveryApi";
-import type { Feature, Story } from "../types";
-import { useWorkspace } from "../../shared/hooks/useWorkspace";
+import { getBoard, updateStory } from "../services/deliveryApi";
+import type { BoardColumn, Feature, Story } from "../types";
 
 const columns = [
   { key: "todo", title: "A fazer", color: "#e2e8f0" },
@@ -17,28 +16,72 @@ const laneTone: Record<string, { border: string; bg: string }> = {
   high: { border: "#dc2626", bg: "linear-gradient(180deg, #fef2f2 0%, #fee2e2 100%)" },
 };
 
-export default function BoardPage() {
-  const workspace = useWorkspace();
+export default function BoardPage({ productId }: { productId: number | null }) {
   const [features, setFeatures] = useState<Feature[]>([]);
   const [stories, setStories] = useState<Story[]>([]);
+  const [totals, setTotals] = useState<Record<string, { count: number; estimate: number }>>({});
+  const [nextCursors, setNextCursors] = useState<Record<string, string | null>>({});
+  const [loadingMore, setLoadingMore] = useState<string | null>(null);
   const [draggingId, setDraggingId] = useState<string | null>(null);
-  const [loading, setLoading] = useState(true);
+  const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
+    if (!productId) {
+      setFeatures([]);
+      setStories([]);
+      setTotals({});
+      setNextCursors({});
+      return;
+    }
     let mounted = true;
-    Promise.all([listFeatures(), listStories()])
-      .then(([fData, sData]) => {
+    setLoading(true);
+    getBoard(productId)
+      .then((board) => {
         if (!mounted) return;
-        setFeatures(fData);
-        setStories(sData);
+        setFeatures(board.features);
+        setStories(board.columns.flatMap((col) => col.stories));
+        setTotals(
+          Object.fromEntries(
+            board.columns.map((col) => [col.status, { count: col.count, estimate: col.estimate_total }])
+          )
+        );
+        setNextCursors(Object.fromEntries(board.columns.map((col) => [col.status, col.next_cursor ?? null])));
+        setError(null);
       })
-      .catch((err: Error) => setError(err.message ?? "Failed to load board"))
-      .finally(() => setLoading(false));
+      .catch((err: Error) => mounted && setError(err.message ?? "Failed to load board"))
+      .finally(() => mounted && setLoading(false));
     return () => {
       mounted = false;
     };
-  }, [workspace.id]);
+  }, [productId]);
+
+  const loadMore = async (status: BoardColumn["status"]) => {
+    const cursor = nextCursors[status];
+    if (!productId || !cursor) return;
+    setLoadingMore(status);
+    try {
+      const board = await getBoard(productId, { status, cursor });
+      const column = board.columns.find((col) => col.status === status);
+      if (!column) return;
+      // The page only carries the features of its own stories.
+      setFeatures((prev) => {
+        const known = new Set(prev.map((f) => f.id));
+        const added = board.features.filter((f) => !known.has(f.id));
+        return added.length ? [...prev, ...added].sort((a, b) => a.title.localeCompare(b.title)) : prev;
+      });
+      // A story dragged into this column may already be on screen.
+      setStories((prev) => {
+        const known = new Set(prev.map((s) => s.id));
+        return [...prev, ...column.stories.filter((s) => !known.has(s.id))];
+      });
+      setNextCursors((prev) => ({ ...prev, [status]: column.next_cursor ?? null }));
+    } catch (err) {
+      setError(err instanceof Error ? err.message : "Failed to load board");
+    } finally {
+      setLoadingMore(null);
+    }
+  };
 
   const featureLanes = useMemo(() => {
     const map = new Map<string, { feature: Feature; stories: Story[] }>();
@@ -50,22 +93,47 @@ export default function BoardPage() {
     return Array.from(map.values());
   }, [features, stories]);
 
+  const moveTotals = (from: string, to: string, estimate: number) => {
+    setTotals((prev) => {
+      const source = prev[from] ?? { count: 0, estimate: 0 };
+      const target = prev[to] ?? { count: 0, estimate: 0 };
+      return {
+        ...prev,
+        [from]: { count: source.count - 1, estimate: source.estimate - estimate },
+        [to]: { count: target.count + 1, estimate: target.estimate + estimate },
+      };
+    });
+  };
+
   const handleDrop = async (storyId: string, status: "todo" | "doing" | "done") => {
     const story = stories.find((s) => s.id === storyId);
-    if (!story || (story.status ?? "todo") === status) return;
+    const previousStatus = story?.status ?? "todo";
+    if (!story || previousStatus === status) return;
     setStories((prev) => prev.map((s) => (s.id === storyId ? { ...s, status } : s)));
+    moveTotals(previousStatus, status, story.estimate ?? 0);
     try {
       await updateStory(storyId, { status });
     } catch (err) {
       const msg = err instanceof Error ? err.message : "Erro ao mover story";
       setError(msg);
       setStories((prev) => prev.map((s) => (s.id === storyId ? story : s)));
+      moveTotals(status, previousStatus, story.estimate ?? 0);
     }
   };
 
+  if (!productId) {
+    return (
+      <>
+        <PageHeader title="Board" subtitle="Delivery -> Kanban de features e stories" />
+        <div className="card" style={{ padding: 16 }}>
+          Selecione um produto para ver o board.
+        </div>
+      </>
+    );
+  }
   if (loading) return <p>Loading board...</p>;
   if (error) return <p style={{ color: "#b91c1c" }}>{error}</p>;
-  if (featureLanes.length === 0) return <EmptyState title="Sem features" description="Crie features para usar o board." />;
+  if (featureLanes.length === 0) return <EmptyState title="Sem stories" description="Crie stories nas features do produto para usar o board." />;
 
   return (
     <>
@@ -100,6 +168,19 @@ export default function BoardPage() {
               }}
             >
               {col.title}
+              <div style={{ fontSize: 12, fontWeight: 500, color: "#475569" }}>
+                {totals[col.key]?.count ?? 0} stories · Est: {totals[col.key]?.estimate ?? 0}
+              </div>
+              {nextCursors[col.key] && (
+                <button
+                  type="button"
+                  onClick={() => loadMore(col.key)}
+                  disabled={loadingMore === col.key}
+                  style={{ marginTop: 6, fontSize: 12 }}
+                >
+                  {loadingMore === col.key ? "Carregando..." : "Carregar mais"}
+                </button>
+              )}
             </div>
           ))}
         </div>
@@ -15,8 +15,10 @@ import {
   updateFeature,
 } from "../services/deliveryApi";
 import type { Feature } from "../types";
+import { useWorkspace } from "../../shared/hooks/useWorkspace";
 
 export default function FeaturesPage() {
+  const workspace = useWorkspace();
   const [features, setFeatures] = useState<Feature[]>([]);
   const [personas, setPersonas] = useState<Persona[]>([]);
   const [journeys, setJourneys] = useState<UserJourney[]>([]);
@@ -43,7 +45,7 @@ export default function FeaturesPage() {
     async (productId: number) => {
       const [featureData, personaData, journeyData, inceptionData] = await Promise.all([
         listFeatures(productId),
-        getPersonas(),
+        getPersonas(workspace.id),
         getUserJourneys(),
         listInceptions("lean_inception", true),
       ]);
@@ -56,7 +58,7 @@ export default function FeaturesPage() {
         setSelectedInceptionId(sorted[0].id);
       }
     },
-    [selectedInceptionId]
+    [selectedInceptionId, workspace.id]
   );
 
   useEffect(() => {
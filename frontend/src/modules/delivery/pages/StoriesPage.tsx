@@ -20,7 +20,7 @@ export default function StoriesPage() {
 
   useEffect(() => {
     let isMounted = true;
-    Promise.all([listStories(), listFeatures()])
+    Promise.all([listStories(workspace.id), listFeatures()])
       .then(([storyData, featureData]) => {
         if (!isMounted) return;
         setStories(storyData);
@@ -36,7 +36,7 @@ export default function StoriesPage() {
     return () => {
       isMounted = false;
     };
-  }, []);
+  }, [workspace.id]);
 
   const handleCreate = async (payload: StoryCreate) => {
     const normalized = {
@@ -1,6 +1,6 @@
 import { afterEach, describe, expect, it, vi } from "vitest";
 
-import { createFeature, importFeaturesFromInception, listFeatures } from "./deliveryApi";
+import { createFeature, getBoard, importFeaturesFromInception, listFeatures } from "./deliveryApi";
 
 describe("deliveryApi", () => {
   afterEach(() => {
@@ -12,6 +12,7 @@ describe("deliveryApi", () => {
     const payload = [{ id: "1", title: "F1", status: "draft" }];
     const fetchMock = vi.fn().mockResolvedValue({
       ok: true,
+      headers: new Headers(),
       json: async () => payload,
     });
     vi.stubGlobal("fetch", fetchMock);
@@ -22,6 +23,24 @@ describe("deliveryApi", () => {
     expect(result).toEqual(payload);
   });
 
+  it("getBoard calls board endpoint with product filter", async () => {
+    const payload = {
+      product_id: 7,
+      features: [],
+      columns: [{ status: "todo", count: 0, estimate_total: 0, stories: [], next_cursor: null }],
+    };
+    const fetchMock = vi.fn().mockResolvedValue({
+      ok: true,
+      json: async () => payload,
+    });
+    vi.stubGlobal("fetch", fetchMock);
+
+    const result = await getBoard(7);
+
+    expect(fetchMock).toHaveBeenCalledWith("http://127.0.0.1:8000/delivery/board?product_id=7");
+    expect(result).toEqual(payload);
+  });
+
   it("createFeature sends POST body", async () => {
     const payload = { id: "1", title: "F1", status: "todo" };
     const fetchMock = vi.fn().mockResolvedValue({
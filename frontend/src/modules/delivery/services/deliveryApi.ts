@@ -1,10 +1,11 @@
-﻿const API_URL = import.meta.env.VITE_API_URL ?? "http://127.0.0.1:8000";
+﻿import { fetchAllPages } from "../../shared/services/pagination";
+import type { Board, BoardColumn, Feature, Story } from "../types";
+
+const API_URL = import.meta.env.VITE_API_URL ?? "http://127.0.0.1:8000";
 
 export async function listFeatures(productId?: number) {
   const query = productId ? `?product_id=${productId}` : "";
-  const res = await fetch(`${API_URL}/delivery/features${query}`);
-  if (!res.ok) throw new Error("Failed to load features");
-  return res.json();
+  return fetchAllPages<Feature>(`${API_URL}/delivery/features${query}`, "Failed to load features");
 }
 
 export async function createFeature(data: {
@@ -78,9 +79,20 @@ export async function importFeaturesFromInception(data: {
   return res.json() as Promise<{ imported_count: number; skipped_count: number }>;
 }
 
-export async function listStories() {
-  const res = await fetch(`${API_URL}/delivery/stories`);
-  if (!res.ok) throw new Error("Failed to load stories");
+export async function listStories(workspaceId?: number) {
+  const query = workspaceId ? `?workspace_id=${workspaceId}` : "";
+  return fetchAllPages<Story>(`${API_URL}/delivery/stories${query}`, "Failed to load stories");
+}
+
+// Without a column, loads the first page of every column; with one, loads the
+// page of that column after its next_cursor.
+export async function getBoard(
+  productId: number,
+  column?: { status: BoardColumn["status"]; cursor: string }
+): Promise<Board> {
+  const query = column ? `&status=${column.status}&cursor=${encodeURIComponent(column.cursor)}` : "";
+  const res = await fetch(`${API_URL}/delivery/board?product_id=${productId}${query}`);
+  if (!res.ok) throw new Error("Failed to load board");
   return res.json();
 }
 
@@ -36,6 +36,20 @@ export interface Story {
   workspace_id?: number | null;
 }
 
+export interface BoardColumn {
+  status: "todo" | "doing" | "done";
+  count: number;
+  estimate_total: number;
+  stories: Story[];
+  next_cursor?: string | null;
+}
+
+export interface Board {
+  product_id: number;
+  features: Feature[];
+  columns: BoardColumn[];
+}
+
 export interface StoryCreate {
   feature_id?: string | null;
   workspace_id?: number | null;
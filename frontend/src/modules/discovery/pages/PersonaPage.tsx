@@ -4,8 +4,10 @@ import { EmptyState } from "../components/EmptyState";
 import PersonaForm from "../components/PersonaForm";
 import { createPersona, deletePersona, getPersonas, getProblems, updatePersona } from "../services/discoveryApi";
 import type { Persona, PersonaCreate, Problem } from "../types";
+import { useWorkspace } from "../../shared/hooks/useWorkspace";
 
 export default function PersonasPage() {
+  const workspace = useWorkspace();
   const [personas, setPersonas] = useState<Persona[]>([]);
   const [problems, setProblems] = useState<Problem[]>([]);
   const [selectedProblemId, setSelectedProblemId] = useState("");
@@ -22,7 +24,7 @@ export default function PersonasPage() {
 
   useEffect(() => {
     let mounted = true;
-    Promise.all([getPersonas(), getProblems()])
+    Promise.all([getPersonas(workspace.id), getProblems(workspace.id)])
       .then(([personaData, problemData]) => {
         if (!mounted) return;
         setPersonas(personaData);
@@ -33,7 +35,7 @@ export default function PersonasPage() {
     return () => {
       mounted = false;
     };
-  }, []);
+  }, [workspace.id]);
 
   const filtered = useMemo(() => {
     if (!selectedProblemId) return personas;
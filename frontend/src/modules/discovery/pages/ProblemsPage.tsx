@@ -21,14 +21,14 @@ export default function ProblemsPage() {
 
   useEffect(() => {
     let mounted = true;
-    getProblems()
+    getProblems(workspace.id)
       .then((data) => mounted && setProblems(data))
       .catch((err: Error) => mounted && setError(err.message ?? "Erro ao carregar problemas"))
       .finally(() => mounted && setLoading(false));
     return () => {
       mounted = false;
     };
-  }, []);
+  }, [workspace.id]);
 
   const filtered = useMemo(() => {
     if (activeFilter === "all") return problems;
@@ -9,8 +9,10 @@ import {
   updateUserJourney,
 } from "../services/discoveryApi";
 import type { Persona, UserJourney } from "../types";
+import { useWorkspace } from "../../shared/hooks/useWorkspace";
 
 export default function UserJourneysPage() {
+  const workspace = useWorkspace();
   const [personas, setPersonas] = useState<Persona[]>([]);
   const [journeys, setJourneys] = useState<UserJourney[]>([]);
   const [newJourneyName, setNewJourneyName] = useState("");
@@ -22,7 +24,7 @@ export default function UserJourneysPage() {
 
   useEffect(() => {
     let isMounted = true;
-    Promise.all([getPersonas(), getUserJourneys()])
+    Promise.all([getPersonas(workspace.id), getUserJourneys()])
       .then(([personaData, journeyData]) => {
         if (!isMounted) return;
         setPersonas(personaData);
@@ -38,7 +40,7 @@ export default function UserJourneysPage() {
     return () => {
       isMounted = false;
     };
-  }, []);
+  }, [workspace.id]);
 
   const personaNameById = useMemo(() => {
     const map = new Map<string, string>();
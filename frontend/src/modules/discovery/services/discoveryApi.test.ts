@@ -23,6 +23,7 @@ describe("discoveryApi", () => {
     const payload = [{ id: "1", title: "P1", workspace_id: 1, status: "open" }];
     const fetchMock = vi.fn().mockResolvedValue({
       ok: true,
+      headers: new Headers(),
       json: async () => payload,
     });
     vi.stubGlobal("fetch", fetchMock);
@@ -33,6 +34,19 @@ describe("discoveryApi", () => {
     expect(result).toEqual(payload);
   });
 
+  it("getProblems filters by workspace when given one", async () => {
+    const fetchMock = vi.fn().mockResolvedValue({
+      ok: true,
+      headers: new Headers(),
+      json: async () => [],
+    });
+    vi.stubGlobal("fetch", fetchMock);
+
+    await getProblems(1);
+
+    expect(fetchMock).toHaveBeenCalledWith("http://localhost:8000/discovery/problems?workspace_id=1");
+  });
+
   it("createProblem sends POST with JSON body", async () => {
     const payload = { id: "1", title: "P1", workspace_id: 1, status: "open" };
     const fetchMock = vi.fn().mockResolvedValue({
@@ -132,6 +146,7 @@ describe("discoveryApi", () => {
     const payload = [{ id: "o1", product_id: 1, objective: "Obj", key_results: [] }];
     const fetchMock = vi.fn().mockResolvedValue({
       ok: true,
+      headers: new Headers(),
       json: async () => payload,
     });
     vi.stubGlobal("fetch", fetchMock);
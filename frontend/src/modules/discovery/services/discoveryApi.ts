@@ -1,14 +1,12 @@
 // src/modules/discovery/services/discoveryApi.ts
+import { fetchAllPages } from "../../shared/services/pagination";
 import type { Persona, Problem, ProductOkr, UserJourney } from "../types";
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || "http://localhost:8000";
 
-export async function getProblems(): Promise<Problem[]> {
-  const response = await fetch(`${API_BASE_URL}/discovery/problems`);
-  if (!response.ok) {
-    throw new Error("Erro ao buscar problemas");
-  }
-  return response.json();
+export async function getProblems(workspaceId?: number): Promise<Problem[]> {
+  const query = workspaceId ? `?workspace_id=${workspaceId}` : "";
+  return fetchAllPages<Problem>(`${API_BASE_URL}/discovery/problems${query}`, "Erro ao buscar problemas");
 }
 
 export async function createProblem(data: {
@@ -72,12 +70,9 @@ export async function deleteProblem(problemId: string): Promise<void> {
   }
 }
 
-export async function getPersonas(): Promise<Persona[]> {
-  const response = await fetch(`${API_BASE_URL}/discovery/personas`);
-  if (!response.ok) {
-    throw new Error("Erro ao buscar personas");
-  }
-  return response.json();
+export async function getPersonas(workspaceId?: number): Promise<Persona[]> {
+  const query = workspaceId ? `?workspace_id=${workspaceId}` : "";
+  return fetchAllPages<Persona>(`${API_BASE_URL}/discovery/personas${query}`, "Erro ao buscar personas");
 }
 
 export async function createPersona(data: {
@@ -145,11 +140,7 @@ export async function deletePersona(personaId: string): Promise<void> {
 }
 
 export async function getUserJourneys(): Promise<UserJourney[]> {
-  const response = await fetch(`${API_BASE_URL}/discovery/journeys`);
-  if (!response.ok) {
-    throw new Error("Erro ao buscar jornadas");
-  }
-  return response.json();
+  return fetchAllPages<UserJourney>(`${API_BASE_URL}/discovery/journeys`, "Erro ao buscar jornadas");
 }
 
 export async function createUserJourney(data: {
@@ -201,11 +192,7 @@ export async function deleteUserJourney(journeyId: string): Promise<void> {
 }
 
 export async function getProductOkrs(productId: number): Promise<ProductOkr[]> {
-  const response = await fetch(`${API_BASE_URL}/discovery/okrs?product_id=${productId}`);
-  if (!response.ok) {
-    throw new Error("Erro ao buscar OKRs");
-  }
-  return response.json();
+  return fetchAllPages<ProductOkr>(`${API_BASE_URL}/discovery/okrs?product_id=${productId}`, "Erro ao buscar OKRs");
 }
 
 export async function createProductOkr(data: {
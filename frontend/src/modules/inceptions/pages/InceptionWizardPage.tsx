@@ -261,7 +261,7 @@ export default function InceptionWizardPage() {
 
   useEffect(() => {
     let isMounted = true;
-    Promise.all([listInceptions("lean_inception"), getPersonas(), getProblems()])
+    Promise.all([listInceptions("lean_inception"), getPersonas(workspace.id), getProblems(workspace.id)])
       .then(([inceptionData, personaData, problemData]) => {
         if (!isMounted) return;
         setInceptions(inceptionData);
@@ -281,7 +281,7 @@ export default function InceptionWizardPage() {
     return () => {
       isMounted = false;
     };
-  }, []);
+  }, [workspace.id]);
 
   useEffect(() => {
     if (!selectedInceptionId) return;
@@ -12,6 +12,7 @@ describe("inceptionApi", () => {
     const payload = [{ id: "1", type: "lean_inception", title: "Lean Inception" }];
     const fetchMock = vi.fn().mockResolvedValue({
       ok: true,
+      headers: new Headers(),
       json: async () => payload,
     });
     vi.stubGlobal("fetch", fetchMock);
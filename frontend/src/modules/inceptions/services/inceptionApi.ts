@@ -1,3 +1,6 @@
+import { fetchAllPages } from "../../shared/services/pagination";
+import type { Inception } from "../types";
+
 const API_URL = import.meta.env.VITE_API_URL ?? "http://127.0.0.1:8000";
 
 export async function listInceptions(type?: string, includeArchived = false) {
@@ -6,9 +9,7 @@ export async function listInceptions(type?: string, includeArchived = false) {
   if (includeArchived) params.set("include_archived", "true");
   const qs = params.toString();
   const url = qs ? `${API_URL}/inceptions?${qs}` : `${API_URL}/inceptions`;
-  const res = await fetch(url);
-  if (!res.ok) throw new Error("Failed to load inceptions");
-  return res.json();
+  return fetchAllPages<Inception>(url, "Failed to load inceptions");
 }
 
 export async function createInception(data: {
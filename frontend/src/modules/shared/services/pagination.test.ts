@@ -0,0 +1,40 @@
+import { afterEach, describe, expect, it, vi } from "vitest";
+
+import { fetchAllPages } from "./pagination";
+
+describe("fetchAllPages", () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+    vi.restoreAllMocks();
+  });
+
+  it("follows X-Next-Cursor until the last page", async () => {
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce({
+        ok: true,
+        headers: new Headers({ "X-Next-Cursor": "abc=" }),
+        json: async () => [{ id: "1" }],
+      })
+      .mockResolvedValueOnce({
+        ok: true,
+        headers: new Headers(),
+        json: async () => [{ id: "2" }],
+      });
+    vi.stubGlobal("fetch", fetchMock);
+
+    const result = await fetchAllPages("http://localhost:8000/discovery/okrs?product_id=1", "failed");
+
+    expect(fetchMock).toHaveBeenNthCalledWith(1, "http://localhost:8000/discovery/okrs?product_id=1");
+    expect(fetchMock).toHaveBeenNthCalledWith(2, "http://localhost:8000/discovery/okrs?product_id=1&cursor=abc%3D");
+    expect(result).toEqual([{ id: "1" }, { id: "2" }]);
+  });
+
+  it("throws when a page fails", async () => {
+    vi.stubGlobal("fetch", vi.fn().mockResolvedValue({ ok: false, headers: new Headers(), json: async () => ({}) }));
+
+    await expect(fetchAllPages("http://localhost:8000/delivery/stories", "Failed to load stories")).rejects.toThrow(
+      "Failed to load stories"
+    );
+  });
+});
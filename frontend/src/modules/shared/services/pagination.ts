@@ -0,0 +1,16 @@
+const NEXT_CURSOR_HEADER = "X-Next-Cursor";
+
+// List endpoints return one page at a time and send the next page's cursor in
+// the X-Next-Cursor header; this follows it until the list is complete.
+export async function fetchAllPages<T>(url: string, errorMessage: string): Promise<T[]> {
+  const items: T[] = [];
+  const separator = url.includes("?") ? "&" : "?";
+  let cursor: string | null = null;
+  do {
+    const res = await fetch(cursor ? `${url}${separator}cursor=${encodeURIComponent(cursor)}` : url);
+    if (!res.ok) throw new Error(errorMessage);
+    items.push(...((await res.json()) as T[]));
+    cursor = res.headers.get(NEXT_CURSOR_HEADER);
+  } while (cursor);
+  return items;
+}
@@ -0,0 +1,87 @@
+"""Compare response serialization strategies for a large story list.
+
+Usage: python scripts/bench_serialization.py [--rows 10000] [--repeat 5]
+
+Measures the three ways a `response_model=list[StoryResponse]` route can be
+encoded from ORM rows:
+
+- jsonable_encoder: validate, dump to Python, jsonable_encoder + json.dumps
+  (JSONResponse, the path FastAPI used before its dump_json fast path)
+- orjson: validate, dump to JSON-compatible Python, orjson.dumps
+  (what setting ORJSONResponse as default_response_class does)
+- dump_json: TypeAdapter(list[...]) validate + dump_json in pydantic-core
+  (FastAPI's default when the response class is left unset)
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.modules.delivery import models, schemas  # noqa: E402
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional for the benchmark only
+    orjson = None
+
+
+def build_rows(count: int) -> list[models.Story]:
+    feature_id = uuid.uuid4()
+    return [
+        models.Story(
+            id=uuid.uuid4(),
+            feature_id=feature_id,
+            workspace_id=1,
+            title=f"Story {index}",
+            description="Como usuário quero acompanhar o progresso das entregas.",
+            acceptance_criteria="Dado um produto publicado, quando abro o board, então vejo as histórias.",
+            estimate=index % 13,
+            status=models.StoryStatus.todo,
+        )
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    adapter = TypeAdapter(list[schemas.StoryResponse])
+
+    strategies = {
+        "jsonable_encoder": lambda: json.dumps(
+            jsonable_encoder(adapter.dump_python(adapter.validate_python(rows, from_attributes=True)))
+        ).encode("utf-8"),
+        "dump_json": lambda: adapter.dump_json(adapter.validate_python(rows, from_attributes=True)),
+    }
+    if orjson is not None:
+        strategies["orjson"] = lambda: orjson.dumps(
+            adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")
+        )
+
+    baseline = None
+    print(f"{args.rows} rows, best of {args.repeat}")
+    for name, encode in strategies.items():
+        best = min(_timed(encode) for _ in range(args.repeat))
+        baseline = baseline or best
+        print(f"  {name:<17} {best * 1000:8.1f} ms  {baseline / best:5.2f}x")
+
+
+def _timed(encode) -> float:
+    started = time.perf_counter()
+    encode()
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, get_async_db, get_db
+from app.core.query_stats import after_cursor_execute, before_cursor_execute, handle_error
+from app.main import app
+
+
+@pytest.fixture
+def database(tmp_path):
+    """A fresh SQLite database behind the app's get_db/get_async_db; yields a session factory."""
+    path = tmp_path / "routes.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    # Same statement accounting as the app's engines, so Server-Timing counts these queries too.
+    for sync_engine in (engine, async_engine.sync_engine):
+        event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+        event.listen(sync_engine, "handle_error", handle_error)
+
+    def override_db():
+        with session_factory() as db:
+            yield db
+
+    async def override_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_async_db] = override_async_db
+    try:
+        yield session_factory
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_async_db, None)
+        asyncio.run(async_engine.dispose())
+        engine.dispose()
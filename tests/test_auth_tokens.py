@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from app.core import security
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.main import app
+
+
+client = TestClient(app)
+
+
+def test_decode_access_token_caches_until_expiry(monkeypatch):
+    token = security.create_access_token({"sub": "cached@example.com"})
+    assert security.decode_access_token(token)["sub"] == "cached@example.com"
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token decoded twice")
+
+    monkeypatch.setattr(jwt, "decode", fail_decode)
+    assert security.decode_access_token(token)["sub"] == "cached@example.com"
+
+
+def test_decode_access_token_rejects_expired_and_tampered_tokens():
+    expired = jwt.encode(
+        {"sub": "old@example.com", "exp": security.datetime.utcnow() - timedelta(minutes=1)},
+        settings.secret_key,
+        algorithm=settings.algorithm,
+    )
+    tampered = security.create_access_token({"sub": "x@example.com"})[:-2] + "xx"
+
+    for token in (expired, tampered):
+        with pytest.raises(HTTPException) as exc_info:
+            security.decode_access_token(token)
+        assert exc_info.value.status_code == 401
+
+
+def test_me_requires_bearer_token():
+    response = client.get("/auth/me")
+
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired_entries():
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+    cache.set("d", 4, ttl=0)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.get("d") is None
@@ -0,0 +1,134 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app import backfill as backfill_module
+from app.models.backfill import BackfillRun
+from app.modules.discovery.models import Persona, ProductOKR, UserJourney
+from app.modules.inceptions.models import InceptionStep
+from app.modules.workspace.models import ProductBlueprint
+
+
+@pytest.fixture
+def session_factory(database, monkeypatch):
+    monkeypatch.setattr(backfill_module, "SessionLocal", database)
+    return database
+
+
+def _persona(session_factory) -> str:
+    with session_factory() as db:
+        persona = Persona(name="Ana", problem_id=uuid.uuid4())
+        db.add(persona)
+        db.commit()
+        return str(persona.id)
+
+
+def _journeys(session_factory) -> list[tuple[str, list[str]]]:
+    with session_factory() as db:
+        return [(journey.name, journey.stages) for journey in db.scalars(select(UserJourney).order_by(UserJourney.name))]
+
+
+def test_journeys_are_copied_from_blueprints(session_factory):
+    persona_id = _persona(session_factory)
+    with session_factory() as db:
+        db.add(
+            ProductBlueprint(
+                product_id=1,
+                journeys=[
+                    {"persona_id": persona_id, "name": " Onboarding ", "stages": [{"stage": "Sign up"}, "Invite", " "]},
+                    {"persona_id": persona_id, "name": "onboarding", "stages": ["Duplicate"]},
+                    {"persona_id": str(uuid.uuid4()), "name": "Unknown persona"},
+                    {"persona_id": persona_id, "name": ""},
+                ],
+            )
+        )
+        db.commit()
+
+    assert backfill_module.run_backfill("journeys") == 1
+    assert _journeys(session_factory) == [("Onboarding", ["Sign up", "Invite"])]
+
+
+def test_completed_backfill_is_skipped_until_forced(session_factory):
+    persona_id = _persona(session_factory)
+    with session_factory() as db:
+        db.add(ProductBlueprint(product_id=1, journeys=[{"persona_id": persona_id, "name": "Onboarding"}]))
+        db.commit()
+    assert backfill_module.run_backfill("journeys") == 1
+
+    with session_factory() as db:
+        db.add(ProductBlueprint(product_id=2, journeys=[{"persona_id": persona_id, "name": "Checkout"}]))
+        db.commit()
+    skipped = backfill_module.run_backfill("journeys")
+    journeys_after_skip = _journeys(session_factory)
+    forced = backfill_module.run_backfill("journeys", force=True)
+    forced_again = backfill_module.run_backfill("journeys", force=True)
+
+    assert skipped is None
+    assert [name for name, _ in journeys_after_skip] == ["Onboarding"]
+    assert (forced, forced_again) == (1, 0)
+    assert [name for name, _ in _journeys(session_factory)] == ["Checkout", "Onboarding"]
+    with session_factory() as db:
+        assert db.get(BackfillRun, "journeys").rows_affected == 0
+
+
+def test_okrs_are_copied_from_blueprints(session_factory):
+    with session_factory() as db:
+        db.add_all(
+            [
+                ProductBlueprint(
+                    product_id=1,
+                    metrics={
+                        "objectives": [
+                            {"objective": "Grow", "key_results": [" 10% more users ", ""]},
+                            {"objective": "Keep"},
+                        ]
+                    },
+                ),
+                ProductBlueprint(product_id=2, metrics={"objective": "Retain", "key_results": ["Churn below 2%"]}),
+            ]
+        )
+        db.add(ProductOKR(product_id=1, objective="keep", key_results=[]))
+        db.commit()
+
+    assert backfill_module.run_backfill("okrs") == 2
+    with session_factory() as db:
+        okrs = {(okr.product_id, okr.objective): okr.key_results for okr in db.scalars(select(ProductOKR))}
+        backfilled = [blueprint.backfilled_at for blueprint in db.scalars(select(ProductBlueprint))]
+    assert okrs == {
+        (1, "Grow"): ["10% more users"],
+        (1, "keep"): [],
+        (2, "Retain"): ["Churn below 2%"],
+    }
+    assert all(backfilled)
+
+
+def test_boundaries_are_copied_from_the_source_inception(session_factory):
+    inception_id, other_inception_id = uuid.uuid4(), uuid.uuid4()
+    with session_factory() as db:
+        db.add_all(
+            [
+                ProductBlueprint(product_id=1, source_inception_id=inception_id),
+                ProductBlueprint(product_id=2, source_inception_id=other_inception_id, boundaries={"is": ["Kept"]}),
+                InceptionStep(inception_id=inception_id, step_key="boundaries", payload={"is": ["A CRM"], "does": ["Sync"]}),
+                InceptionStep(inception_id=other_inception_id, step_key="boundaries", payload={"is": ["Replaced"]}),
+            ]
+        )
+        db.commit()
+
+    assert backfill_module.run_backfill("boundaries") == 1
+    with session_factory() as db:
+        boundaries = {blueprint.product_id: blueprint.boundaries for blueprint in db.scalars(select(ProductBlueprint))}
+    assert boundaries == {
+        1: {"is": ["A CRM"], "is_not": [], "does": ["Sync"], "does_not": []},
+        2: {"is": ["Kept"]},
+    }
+
+
+def test_cli_runs_every_backfill_once(session_factory, capsys):
+    backfill_module.main(["all"])
+    backfill_module.main(["all"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:3] == ["journeys: 0 rows affected", "okrs: 0 rows affected", "boundaries: 0 rows affected"]
+    assert lines[3:] == [f"{name}: already completed, skipping (use --force to rerun)" for name in backfill_module.BACKFILLS]
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.modules.delivery.models import Feature, Story, StoryStatus
+
+
+client = TestClient(app)
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _seed(database) -> None:
+    with database() as db:
+        ours, theirs = Feature(title="Checkout", product_id=1), Feature(title="Search", product_id=2)
+        db.add_all([ours, theirs])
+        db.flush()
+        db.add_all(
+            [
+                Story(title="Todo 2", feature_id=ours.id, estimate=5, created_at=START + timedelta(minutes=2)),
+                Story(title="Todo 0", feature_id=ours.id, estimate=3, created_at=START),
+                Story(title="Todo 1", feature_id=ours.id, created_at=START + timedelta(minutes=1)),
+                Story(title="Doing", feature_id=ours.id, estimate=8, status=StoryStatus.doing, created_at=START),
+                Story(title="Other product", feature_id=theirs.id, estimate=13, created_at=START),
+            ]
+        )
+        db.commit()
+
+
+def _columns(response) -> dict[str, dict]:
+    assert response.status_code == 200
+    return {column["status"]: column for column in response.json()["columns"]}
+
+
+def test_board_totals_cover_every_story_of_the_product(database):
+    _seed(database)
+
+    response = client.get("/delivery/board", params={"product_id": 1, "limit": 1})
+
+    columns = _columns(response)
+    counts = {status: (column["count"], column["estimate_total"]) for status, column in columns.items()}
+    assert counts == {"todo": (3, 8), "doing": (1, 8), "done": (0, 0)}
+    assert [feature["title"] for feature in response.json()["features"]] == ["Checkout"]
+
+
+def test_board_only_shows_stories_of_the_product(database):
+    _seed(database)
+
+    columns = _columns(client.get("/delivery/board", params={"product_id": 2}))
+
+    assert [story["title"] for story in columns["todo"]["stories"]] == ["Other product"]
+    assert columns["doing"]["stories"] == []
+
+
+def test_board_requires_a_product(database):
+    assert client.get("/delivery/board").status_code == 422
+
+
+def test_board_rejects_an_unknown_status(database):
+    response = client.get("/delivery/board", params={"product_id": 1, "status": "blocked"})
+
+    assert response.status_code == 400
+
+
+def test_board_cursor_requires_a_status(database):
+    response = client.get("/delivery/board", params={"product_id": 1, "cursor": "abc"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "cursor requires status"
+
+
+def test_board_column_is_paginated_in_creation_order(database):
+    _seed(database)
+    first = _columns(client.get("/delivery/board", params={"product_id": 1, "limit": 2}))["todo"]
+
+    rest = _columns(
+        client.get(
+            "/delivery/board",
+            params={"product_id": 1, "status": "todo", "limit": 2, "cursor": first["next_cursor"]},
+        )
+    )
+
+    assert [story["title"] for story in first["stories"]] == ["Todo 0", "Todo 1"]
+    assert list(rest) == ["todo"]
+    assert [story["title"] for story in rest["todo"]["stories"]] == ["Todo 2"]
+    assert rest["todo"]["next_cursor"] is None
+    assert rest["todo"]["count"] == 3
+
+
+def test_board_leaves_out_stories_without_a_feature(database):
+    _seed(database)
+    with database() as db:
+        db.add(Story(title="No feature", workspace_id=1, estimate=21, created_at=START))
+        db.commit()
+
+    columns = _columns(client.get("/delivery/board", params={"product_id": 1}))
+
+    assert "No feature" not in [story["title"] for story in columns["todo"]["stories"]]
+    assert (columns["todo"]["count"], columns["todo"]["estimate_total"]) == (3, 8)
+
+
+def test_board_features_are_those_of_the_returned_stories(database):
+    _seed(database)
+    with database() as db:
+        alerts = Feature(title="Alerts", product_id=1)
+        db.add_all([alerts, Feature(title="Empty", product_id=1)])
+        db.flush()
+        db.add(Story(title="Todo 3", feature_id=alerts.id, created_at=START + timedelta(minutes=3)))
+        db.commit()
+
+    first = client.get("/delivery/board", params={"product_id": 1, "limit": 3})
+    cursor = _columns(first)["todo"]["next_cursor"]
+    rest = client.get("/delivery/board", params={"product_id": 1, "status": "todo", "limit": 3, "cursor": cursor})
+
+    assert [feature["title"] for feature in first.json()["features"]] == ["Checkout"]
+    assert [story["title"] for story in _columns(rest)["todo"]["stories"]] == ["Todo 3"]
+    assert [feature["title"] for feature in rest.json()["features"]] == ["Alerts"]
@@ -0,0 +1,73 @@
+import asyncio
+import dataclasses
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app import bootstrap as bootstrap_module
+from app.core.database import Base
+from app.models.user import User
+from app.modules.workspace.models import Workspace, WorkspaceMember
+
+
+def _run_bootstrap_twice(tmp_path, monkeypatch):
+    database = tmp_path / "bootstrap.db"
+    monkeypatch.setattr(
+        bootstrap_module,
+        "settings",
+        dataclasses.replace(bootstrap_module.settings, database_url=f"sqlite:///{database}", admin_email=None),
+    )
+
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        monkeypatch.setattr(bootstrap_module, "AsyncSessionLocal", session_factory)
+        async with session_factory() as db:
+            db.add(User(email="owner@example.com", password_hash="x"))
+            await db.commit()
+
+        results = [await bootstrap_module.bootstrap(), await bootstrap_module.bootstrap()]
+        async with session_factory() as db:
+            counts = [await db.scalar(select(func.count()).select_from(model)) for model in (Workspace, WorkspaceMember)]
+        await engine.dispose()
+        return results, counts
+
+    return asyncio.run(run())
+
+
+def test_bootstrap_is_idempotent(tmp_path, monkeypatch):
+    results, counts = _run_bootstrap_twice(tmp_path, monkeypatch)
+
+    assert results == [True, True]
+    assert counts == [1, 1]
+
+
+def test_bootstrap_skips_when_lock_is_held(tmp_path, monkeypatch):
+    database = tmp_path / "locked.db"
+    monkeypatch.setattr(
+        bootstrap_module,
+        "settings",
+        dataclasses.replace(bootstrap_module.settings, database_url=f"sqlite:///{database}", admin_email=None),
+    )
+
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        monkeypatch.setattr(bootstrap_module, "AsyncSessionLocal", session_factory)
+        async with session_factory() as db:
+            db.add(User(email="owner@example.com", password_hash="x"))
+            await db.commit()
+
+        result = await bootstrap_module.bootstrap()
+        async with session_factory() as db:
+            workspaces = await db.scalar(select(func.count()).select_from(Workspace))
+        await engine.dispose()
+        return result, workspaces
+
+    with bootstrap_module._try_file_lock(bootstrap_module._lock_file_path()) as locked:
+        assert locked
+        assert asyncio.run(run()) == (False, 0)
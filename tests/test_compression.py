@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.compression import BROTLI_SUPPORTED, BrotliResponder, CompressionMiddleware, accepted_encodings
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100, gzip_level=6, brotli_quality=5)
+
+    @app.get("/large")
+    def large():
+        return {"steps": ["stage"] * 200}
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+def test_large_responses_are_gzipped_and_small_ones_are_not():
+    client = _client()
+
+    large = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.json() == {"steps": ["stage"] * 200}
+    assert int(large.headers["content-length"]) < len(b'"stage",' * 200)
+    assert "content-encoding" not in small.headers
+
+
+def test_accepted_encodings_ignores_refused_codings():
+    assert accepted_encodings("gzip, br;q=0, deflate;q=0.5") == {"gzip", "deflate"}
+    assert accepted_encodings("") == set()
+
+
+def test_brotli_is_preferred_when_the_client_accepts_it():
+    pytest.importorskip("brotli")
+    assert BROTLI_SUPPORTED, "Starlette's IdentityResponder no longer has the async apply_compression hook"
+
+    response = _client().get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == {"steps": ["stage"] * 200}
+    assert int(response.headers["content-length"]) < len(b'"stage",' * 200)
+
+
+def test_large_brotli_bodies_are_compressed_off_the_event_loop(monkeypatch):
+    pytest.importorskip("brotli")
+    threads = {}
+    compress_body = BrotliResponder._compress_body
+
+    def record_thread(self, body, more_body):
+        threads["compression"] = threading.current_thread()
+        return compress_body(self, body, more_body)
+
+    monkeypatch.setattr(BrotliResponder, "_compress_body", record_thread)
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100, gzip_level=6, brotli_quality=5, thread_minimum_size=100)
+
+    @app.get("/large")
+    async def large():
+        threads["endpoint"] = threading.current_thread()
+        return {"steps": ["stage"] * 200}
+
+    response = TestClient(app).get("/large", headers={"Accept-Encoding": "br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert threads["compression"] is not threads["endpoint"]
@@ -0,0 +1,113 @@
+from fastapi import Request, Response
+from fastapi.testclient import TestClient
+
+from app.core.etag import compute_etag, conditional_response
+from app.main import app
+from app.models.user import User
+from app.modules.discovery.models import Problem
+from app.modules.inceptions.models import Inception
+from app.modules.workspace.models import ProductBlueprint, Workspace, WorkspaceProduct
+
+
+client = TestClient(app)
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+def test_compute_etag_changes_with_version_parts():
+    assert compute_etag("steps", "id", 2, "2026-10-18T10:00:00") == compute_etag("steps", "id", 2, "2026-10-18T10:00:00")
+    assert compute_etag("steps", "id", 2, "2026-10-18T10:00:00") != compute_etag("steps", "id", 3, "2026-10-18T10:00:00")
+
+
+def test_conditional_response_tags_fresh_responses():
+    response = Response()
+    etag = compute_etag("problem", 1)
+
+    assert conditional_response(_request(), response, etag) is None
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_conditional_response_returns_304_for_matching_tags():
+    etag = compute_etag("problem", 1)
+
+    for header in (etag, f'"other", W/{etag}', "*"):
+        not_modified = conditional_response(_request(header), Response(), etag)
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+        assert not_modified.body == b""
+
+    assert conditional_response(_request('"other"'), Response(), etag) is None
+
+
+def test_inception_etag_revalidates_until_a_step_changes(database):
+    with database() as db:
+        owner = User(email="etag@example.com", password_hash="x")
+        workspace = Workspace(name="Workspace", owner=owner)
+        db.add(workspace)
+        db.flush()
+        inception = Inception(workspace_id=workspace.id, type="product", title="Acme")
+        db.add(inception)
+        db.commit()
+        path = f"/inceptions/{inception.id}"
+    client.put(f"{path}/steps/vision", json={"payload": {"text": "v1"}})
+
+    first = client.get(path)
+    revalidated = client.get(path, headers={"If-None-Match": first.headers["etag"]})
+    client.put(f"{path}/steps/vision", json={"payload": {"text": "v2"}})
+    edited = client.get(path, headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert edited.status_code == 200
+    assert edited.headers["etag"] != first.headers["etag"]
+    assert edited.json()["steps"][0]["payload"] == {"text": "v2"}
+
+
+def _revalidate(path: str):
+    first = client.get(path)
+    replayed = client.get(path, headers={"If-None-Match": first.headers["etag"]})
+    assert first.status_code == 200
+    assert replayed.status_code == 304
+    assert replayed.content == b""
+    return first.headers["etag"]
+
+
+def test_product_etag_changes_with_the_product_and_its_blueprint(database):
+    with database() as db:
+        workspace = Workspace(name="Workspace", owner=User(email="product@example.com", password_hash="x"))
+        product = WorkspaceProduct(name="Acme", workspace=workspace)
+        db.add(product)
+        db.flush()
+        db.add(ProductBlueprint(product_id=product.id, vision="Sell more"))
+        db.commit()
+        path = f"/workspaces/{workspace.id}/products/{product.id}"
+
+    original = _revalidate(path)
+    client.put(path, json={"name": "Acme 2"})
+    renamed = _revalidate(path)
+    client.put(path, json={"boundaries": {"is": ["A CRM"]}})
+    bounded = _revalidate(path)
+
+    assert len({original, renamed, bounded}) == 3
+    assert client.get(path, headers={"If-None-Match": original}).json()["name"] == "Acme 2"
+
+
+def test_problem_etag_changes_when_the_problem_is_updated(database):
+    with database() as db:
+        problem = Problem(title="Slow checkout")
+        db.add(problem)
+        db.commit()
+        path = f"/discovery/problems/{problem.id}"
+
+    original = _revalidate(path)
+    client.put(path, json={"title": "Very slow checkout"})
+    updated = client.get(path, headers={"If-None-Match": original})
+
+    assert updated.status_code == 200
+    assert updated.headers["etag"] != original
+    assert updated.json()["title"] == "Very slow checkout"
@@ -0,0 +1,89 @@
+import re
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.main import app
+from app.models.user import User
+from app.modules.delivery.models import Feature
+from app.modules.workspace.models import ProductBlueprint, Workspace, WorkspaceProduct
+
+
+client = TestClient(app)
+
+
+def _product(database, features: list[dict]) -> int:
+    with database() as db:
+        workspace = Workspace(name="Workspace", owner=User(email="owner@example.com", password_hash="x"))
+        product = WorkspaceProduct(name="Acme", workspace=workspace)
+        db.add(product)
+        db.flush()
+        db.add(ProductBlueprint(product_id=product.id, features=features))
+        db.commit()
+        return product.id
+
+
+def _import(product_id: int, **options):
+    response = client.post("/delivery/features/import-from-inception", json={"product_id": product_id, **options})
+    assert response.status_code == 200
+    return response
+
+
+def _titles(database, product_id: int) -> list[str]:
+    with database() as db:
+        return sorted(db.scalars(select(Feature.title).where(Feature.product_id == product_id)))
+
+
+def _statements(response) -> int:
+    return int(re.match(r'db;desc="(\d+) queries"', response.headers["server-timing"]).group(1))
+
+
+def test_duplicate_titles_in_a_snapshot_are_imported_once(database):
+    product_id = _product(database, [{"text": "Checkout"}, {"text": " Checkout "}, {"text": "Search"}, {"text": ""}])
+
+    response = _import(product_id)
+
+    assert response.json() == {"imported_count": 2, "skipped_count": 2}
+    assert _titles(database, product_id) == ["Checkout", "Search"]
+
+
+def test_titles_already_on_the_product_are_skipped(database):
+    product_id = _product(database, [{"text": "Checkout"}, {"text": "Search"}])
+    with database() as db:
+        db.add(Feature(product_id=product_id, title="Checkout"))
+        db.commit()
+
+    response = _import(product_id)
+
+    assert response.json() == {"imported_count": 1, "skipped_count": 1}
+    assert _titles(database, product_id) == ["Checkout", "Search"]
+
+
+def test_overwrite_replaces_the_product_features(database):
+    product_id = _product(database, [{"text": "Checkout"}, {"text": "Search"}])
+    with database() as db:
+        db.add_all([Feature(product_id=product_id, title="Checkout"), Feature(product_id=product_id, title="Legacy")])
+        db.commit()
+
+    response = _import(product_id, overwrite_existing=True)
+
+    assert response.json() == {"imported_count": 2, "skipped_count": 0}
+    assert _titles(database, product_id) == ["Checkout", "Search"]
+
+
+def test_import_runs_the_same_statements_for_any_snapshot_size(database):
+    small = _product(database, [{"text": "Feature 0"}])
+    with database() as db:
+        workspace_id = db.get(WorkspaceProduct, small).workspace_id
+        large = WorkspaceProduct(name="Large", workspace_id=workspace_id)
+        db.add(large)
+        db.flush()
+        db.add(ProductBlueprint(product_id=large.id, features=[{"text": f"Feature {index}"} for index in range(50)]))
+        db.commit()
+        large_id = large.id
+
+    small_response = _import(small)
+    large_response = _import(large_id)
+
+    assert large_response.json()["imported_count"] == 50
+    assert _statements(large_response) == _statements(small_response)
@@ -1,5 +1,6 @@
 from fastapi.testclient import TestClient
 
+from app.core.database import async_engine, engine
 from app.main import app
 
 
@@ -11,3 +12,45 @@ def test_health_returns_ok():
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_health_pool_reports_pool_stats():
+    response = client.get("/health/pool")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["checked_out"] == 0
+    assert {"pool_size", "max_overflow", "checkout_wait_avg_ms", "checkout_timeouts"} <= body.keys()
+
+
+def test_health_live_does_not_touch_the_database(monkeypatch):
+    def refuse_checkout(*args, **kwargs):
+        raise AssertionError("a database connection was checked out")
+
+    for pool in (engine.pool, async_engine.sync_engine.pool):
+        monkeypatch.setattr(pool, "connect", refuse_checkout)
+
+    response = client.get("/health/live")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_health_ready_reports_unstamped_schema_as_unavailable(monkeypatch):
+    from app.core import health
+
+    monkeypatch.setattr(health, "_cached_readiness", None)
+    monkeypatch.setattr(health, "_database_versions", _no_versions)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    checks = response.json()["checks"]
+    assert checks["database"]["ok"] is True
+    assert checks["pool"]["ok"] is True
+    assert checks["migrations"]["ok"] is False
+    assert checks["migrations"]["head"]
+
+
+async def _no_versions():
+    return set()
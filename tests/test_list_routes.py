@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.modules.delivery.models import Feature, Story, StoryStatus
+from app.modules.discovery.models import Persona, Problem
+
+
+client = TestClient(app)
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _walk(path: str, limit: int) -> list[list[dict]]:
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(path, params=params)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return pages
+
+
+def test_problems_are_paginated_in_creation_order(database):
+    with database() as db:
+        db.add_all(Problem(title=f"Problem {index}", created_at=START + timedelta(minutes=index)) for index in (2, 0, 1))
+        db.commit()
+
+    pages = _walk("/discovery/problems", limit=2)
+
+    assert [[problem["title"] for problem in page] for page in pages] == [["Problem 0", "Problem 1"], ["Problem 2"]]
+
+
+def test_stories_are_paginated_in_creation_order(database):
+    with database() as db:
+        db.add_all(
+            Story(title=f"Story {index}", workspace_id=1, created_at=START + timedelta(minutes=index)) for index in (1, 2, 0)
+        )
+        db.commit()
+
+    pages = _walk("/delivery/stories", limit=2)
+
+    assert [[story["title"] for story in page] for page in pages] == [["Story 0", "Story 1"], ["Story 2"]]
+
+
+def test_problems_are_filtered_by_workspace(database):
+    with database() as db:
+        db.add_all([Problem(title="Ours", workspace_id=1), Problem(title="Theirs", workspace_id=2)])
+        db.commit()
+
+    response = client.get("/discovery/problems", params={"workspace_id": 1})
+
+    assert [problem["title"] for problem in response.json()] == ["Ours"]
+
+
+def test_personas_are_filtered_by_the_workspace_of_their_problem(database):
+    with database() as db:
+        ours, theirs = Problem(title="Ours", workspace_id=1), Problem(title="Theirs", workspace_id=2)
+        db.add_all([ours, theirs])
+        db.flush()
+        db.add_all([Persona(name="Ana", problem_id=ours.id), Persona(name="Bia", problem_id=theirs.id)])
+        db.commit()
+
+    response = client.get("/discovery/personas", params={"workspace_id": 1})
+
+    assert [persona["name"] for persona in response.json()] == ["Ana"]
+
+
+def test_stories_are_filtered_by_workspace_feature_and_status(database):
+    with database(expire_on_commit=False) as db:
+        feature, other_feature = Feature(title="Checkout"), Feature(title="Search")
+        db.add_all([feature, other_feature])
+        db.flush()
+        db.add_all(
+            [
+                Story(title="Match", workspace_id=1, feature_id=feature.id, status=StoryStatus.doing),
+                Story(title="Other status", workspace_id=1, feature_id=feature.id, status=StoryStatus.todo),
+                Story(title="Other feature", workspace_id=1, feature_id=other_feature.id, status=StoryStatus.doing),
+                Story(title="Other workspace", workspace_id=2, feature_id=feature.id, status=StoryStatus.doing),
+            ]
+        )
+        db.commit()
+
+    response = client.get(
+        "/delivery/stories", params={"workspace_id": 1, "feature_id": str(feature.id), "status": "doing"}
+    )
+
+    assert [story["title"] for story in response.json()] == ["Match"]
+
+
+def test_stories_reject_an_unknown_status(database):
+    response = client.get("/delivery/stories", params={"status": "blocked"})
+
+    assert response.status_code == 400
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.core.metrics import REQUEST_LATENCY, REQUEST_QUERIES, REQUESTS, MetricsMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.main import app as main_app
+
+
+app = FastAPI()
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+
+
+@app.get("/metrics-test/items/{item_id}")
+def get_item(item_id: int):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    return {"id": item_id}
+
+
+client = TestClient(app)
+
+
+def test_requests_are_labelled_by_route_template():
+    route = "/metrics-test/items/{item_id}"
+    before = REQUESTS.value("GET", route, 200)
+
+    client.get("/metrics-test/items/1")
+    client.get("/metrics-test/items/2")
+
+    assert REQUESTS.value("GET", route, 200) == before + 2
+    assert REQUEST_LATENCY.count("GET", route) >= 2
+    assert REQUEST_QUERIES.count("GET", route) >= 2
+
+
+def test_unmatched_paths_share_one_series():
+    before = REQUESTS.value("GET", "<unmatched>", 404)
+
+    client.get("/metrics-test/nope/1")
+    client.get("/metrics-test/nope/2")
+
+    assert REQUESTS.value("GET", "<unmatched>", 404) == before + 2
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    main_client = TestClient(main_app)
+    main_client.get("/health")
+
+    response = main_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/health",le="+Inf"}' in body
+    assert "http_requests_in_flight 1" in body
+    assert 'db_pool_checked_out{pool="sync"} 0' in body
+    assert "# TYPE password_hash_queue_wait_seconds histogram" in body
+
+
+def test_password_hashing_workers_do_not_import_metrics():
+    # Spawned bcrypt workers import app.core.security to unpickle their task.
+    code = "import sys, app.core.security; print('app.core.metrics' in sys.modules)"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,78 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import String, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.core.pagination import NEXT_CURSOR_HEADER, PageParams, decode_cursor, encode_cursor, paginate
+
+
+class PaginationBase(DeclarativeBase):
+    pass
+
+
+class Item(PaginationBase):
+    __tablename__ = "items"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String(50))
+
+
+def _collect_pages(names: list[str], limit: int, descending: bool = False) -> list[list[str]]:
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(PaginationBase.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as db:
+            db.add_all(Item(name=name) for name in names)
+            await db.commit()
+
+            pages = []
+            cursor = None
+            while True:
+                response = Response()
+                items = await paginate(
+                    db,
+                    select(Item),
+                    PageParams(cursor=cursor, limit=limit),
+                    response,
+                    (Item.name, Item.id),
+                    descending=descending,
+                )
+                pages.append([item.name for item in items])
+                cursor = response.headers.get(NEXT_CURSOR_HEADER)
+                if not cursor:
+                    break
+        await engine.dispose()
+        return pages
+
+    return asyncio.run(run())
+
+
+def test_paginate_walks_every_row_once_including_duplicate_sort_keys():
+    pages = _collect_pages(["b", "a", "c", "a", "b"], limit=2)
+
+    assert pages == [["a", "a"], ["b", "b"], ["c"]]
+
+
+def test_paginate_descending_order():
+    pages = _collect_pages(["a", "c", "b"], limit=2, descending=True)
+
+    assert pages == [["c", "b"], ["a"]]
+
+
+def test_cursor_round_trip_restores_column_types():
+    item_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(["x", item_id]), (Item.name, Item.id)) == ["x", item_id]
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        decode_cursor("not-a-cursor", (Item.name, Item.id))
+
+    assert error.value.status_code == 400
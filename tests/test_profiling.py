@@ -0,0 +1,89 @@
+import dataclasses
+import pstats
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.profiling import ProfiledRoute, ProfilingMiddleware, list_profiles
+from app.core.security import CurrentUser, get_admin_user, get_current_user
+from app.main import app as main_app
+from app.modules.admin import router as admin_router
+
+
+def _busy_sync_endpoint_work():
+    return sum(range(1000))
+
+
+router = APIRouter(prefix="/profiled", route_class=ProfiledRoute)
+
+
+@router.get("/items/{item_id}")
+def get_item(item_id: int):
+    return {"id": item_id, "total": _busy_sync_endpoint_work()}
+
+
+def _client(directory, **options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, directory=str(directory), backend="cprofile", **options)
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_sampled_request_profiles_sync_endpoint_thread(tmp_path):
+    client = _client(tmp_path, sample_rate=1.0)
+
+    response = client.get("/profiled/items/1")
+
+    assert response.status_code == 200
+    [profile] = list_profiles(tmp_path)
+    assert "--GET--profiled.items.item_id--" in profile.name
+    functions = {function for _, _, function in pstats.Stats(str(profile)).stats}
+    assert "_busy_sync_endpoint_work" in functions
+
+
+def test_fast_requests_below_the_threshold_are_not_stored(tmp_path):
+    client = _client(tmp_path, slow_threshold_ms=60_000)
+
+    client.get("/profiled/items/1")
+
+    assert list_profiles(tmp_path) == []
+
+
+def test_only_the_newest_profiles_are_kept(tmp_path):
+    client = _client(tmp_path, sample_rate=1.0, max_files=2)
+
+    for item_id in range(3):
+        client.get(f"/profiled/items/{item_id}")
+
+    assert len(list_profiles(tmp_path)) == 2
+
+
+def test_admin_can_list_and_download_profiles(tmp_path, monkeypatch):
+    _client(tmp_path, sample_rate=1.0).get("/profiled/items/1")
+    monkeypatch.setattr(admin_router, "settings", dataclasses.replace(admin_router.settings, profiling_dir=str(tmp_path)))
+    main_app.dependency_overrides[get_admin_user] = lambda: CurrentUser(id=1, email="admin@example.com")
+    try:
+        client = TestClient(main_app)
+        listed = client.get("/admin/profiles")
+        downloaded = client.get(f"/admin/profiles/{listed.json()[0]['name']}")
+        missing = client.get("/admin/profiles/..%2F..%2Fapp.db")
+    finally:
+        main_app.dependency_overrides.pop(get_admin_user, None)
+
+    assert listed.status_code == 200
+    [profile] = listed.json()
+    assert profile["method"] == "GET"
+    assert profile["route"] == "profiled.items.item_id"
+    assert downloaded.status_code == 200
+    assert downloaded.content == (tmp_path / profile["name"]).read_bytes()
+    assert missing.status_code == 404
+
+
+def test_profiles_require_the_admin_user():
+    main_app.dependency_overrides[get_current_user] = lambda: CurrentUser(id=2, email="someone@example.com")
+    try:
+        response = TestClient(main_app).get("/admin/profiles")
+    finally:
+        main_app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 403
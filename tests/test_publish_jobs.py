@@ -0,0 +1,148 @@
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import utcnow
+from app.main import app
+from app.models.user import User
+from app.modules.inceptions import models, service
+from app.modules.workspace.models import Workspace, WorkspaceProduct
+
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def session_factory(database, monkeypatch):
+    monkeypatch.setattr(service, "SessionLocal", database)
+    return database
+
+
+def _create_inception(session_factory, title: str = "Inception") -> models.Inception:
+    with session_factory(expire_on_commit=False) as db:
+        owner = User(email=f"{title.strip() or 'blank'}@example.com", password_hash="x")
+        workspace = Workspace(name=f"Workspace {title}", owner=owner)
+        db.add(workspace)
+        db.flush()
+        inception = models.Inception(workspace_id=workspace.id, type="product", title=title)
+        db.add(inception)
+        db.commit()
+        return inception
+
+
+def _products(session_factory) -> int:
+    with session_factory() as db:
+        return db.query(WorkspaceProduct).count()
+
+
+def test_enqueue_is_idempotent(session_factory):
+    inception = _create_inception(session_factory)
+
+    with session_factory(expire_on_commit=False) as db:
+        inception = db.get(models.Inception, inception.id)
+        first, first_start = service.enqueue_publish_job(db, inception, None)
+        second, second_start = service.enqueue_publish_job(db, inception, None)
+
+    assert (first_start, second_start) == (True, False)
+    assert first.id == second.id
+
+
+def test_failed_job_is_requeued(session_factory):
+    inception = _create_inception(session_factory)
+    with session_factory(expire_on_commit=False) as db:
+        job, _ = service.enqueue_publish_job(db, db.get(models.Inception, inception.id), None)
+        job.status, job.error = "failed", "boom"
+        db.commit()
+
+        requeued, start = service.enqueue_publish_job(db, db.get(models.Inception, inception.id), "Renamed")
+
+    assert start is True
+    assert requeued.id == job.id
+    assert (requeued.status, requeued.error, requeued.name) == ("queued", None, "Renamed")
+
+
+def test_stale_running_job_is_requeued(session_factory):
+    inception = _create_inception(session_factory)
+    with session_factory(expire_on_commit=False) as db:
+        job, _ = service.enqueue_publish_job(db, db.get(models.Inception, inception.id), None)
+        job.status = "running"
+        job.started_at = utcnow()
+        db.commit()
+        _, fresh_start = service.enqueue_publish_job(db, db.get(models.Inception, inception.id), None)
+
+        job.started_at = utcnow() - timedelta(hours=1)
+        db.commit()
+        requeued, stale_start = service.enqueue_publish_job(db, db.get(models.Inception, inception.id), None)
+
+    assert fresh_start is False
+    assert stale_start is True
+    assert requeued.status == "queued"
+
+
+def test_duplicate_run_of_a_claimed_job_does_nothing(session_factory):
+    inception = _create_inception(session_factory)
+    with session_factory(expire_on_commit=False) as db:
+        job, _ = service.enqueue_publish_job(db, db.get(models.Inception, inception.id), None)
+
+    service.run_publish_job(job.id)
+    service.run_publish_job(job.id)
+
+    assert _products(session_factory) == 1
+
+
+def test_async_publish_moves_job_from_queued_to_succeeded(session_factory):
+    inception = _create_inception(session_factory, title="Acme")
+
+    response = client.post(f"/inceptions/{inception.id}/publish-product?mode=async", json={})
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+    job = client.get(f"/inceptions/{inception.id}/publish-jobs/{response.json()['id']}").json()
+    assert job["status"] == "succeeded"
+    assert job["product_id"] is not None
+    assert job["started_at"] is not None
+
+
+def test_async_publish_records_failures_on_the_job(session_factory):
+    inception = _create_inception(session_factory, title="  ")
+
+    response = client.post(f"/inceptions/{inception.id}/publish-product?mode=async", json={})
+
+    job = client.get(f"/inceptions/{inception.id}/publish-jobs/{response.json()['id']}").json()
+    assert job["status"] == "failed"
+    assert job["error"] == "Product name is required to publish"
+
+
+def test_sync_publish_conflicts_with_an_active_job(session_factory):
+    inception = _create_inception(session_factory, title="Acme")
+    with session_factory() as db:
+        service.enqueue_publish_job(db, db.get(models.Inception, inception.id), None)
+
+    response = client.post(f"/inceptions/{inception.id}/publish-product", json={})
+
+    assert response.status_code == 409
+    assert _products(session_factory) == 0
+
+
+def test_sync_publish_records_a_succeeded_job(session_factory):
+    inception = _create_inception(session_factory, title="Acme")
+
+    response = client.post(f"/inceptions/{inception.id}/publish-product", json={})
+    retry = client.post(f"/inceptions/{inception.id}/publish-product?mode=async", json={})
+
+    assert response.status_code == 200
+    assert retry.status_code == 202
+    assert retry.json()["status"] == "succeeded"
+    assert retry.json()["product_id"] == response.json()["product_id"]
+    assert _products(session_factory) == 1
+
+
+def test_publish_job_of_another_inception_is_not_found(session_factory):
+    inception = _create_inception(session_factory, title="Acme")
+    other = _create_inception(session_factory, title="Other")
+    job = client.post(f"/inceptions/{inception.id}/publish-product?mode=async", json={}).json()
+
+    response = client.get(f"/inceptions/{other.id}/publish-jobs/{job['id']}")
+
+    assert response.status_code == 404
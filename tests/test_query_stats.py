@@ -0,0 +1,50 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import engine
+from app.core.query_stats import QueryStatsMiddleware
+
+
+app = FastAPI()
+app.add_middleware(QueryStatsMiddleware)
+
+
+@app.get("/two-queries")
+def two_queries():
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 2"))
+    return {"ok": True}
+
+
+@app.get("/no-queries")
+def no_queries():
+    return {"ok": True}
+
+
+client = TestClient(app)
+
+
+def test_server_timing_counts_statements_of_the_request():
+    response = client.get("/two-queries")
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith('db;desc="2 queries";dur=')
+
+
+def test_server_timing_reports_zero_without_queries():
+    response = client.get("/no-queries")
+
+    assert response.headers["server-timing"].startswith('db;desc="0 queries";dur=')
+
+
+def test_failed_statements_do_not_leave_start_times_behind():
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM no_such_table"))
+        connection.execute(text("SELECT 1"))
+
+        assert connection.info["query_started_at"] == []
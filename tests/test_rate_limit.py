@@ -0,0 +1,96 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.rate_limit import BucketPolicy, DatabaseRateLimitBackend, LoginRateLimiter, MemoryRateLimitBackend
+from app.main import app
+from app.models.rate_limit import RateLimitBucket
+from app.modules.auth import router as auth_router
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _hits(backend, key, policy, count):
+    async def run():
+        return [await backend.hit(key, policy) for _ in range(count)]
+
+    return asyncio.run(run())
+
+
+def test_memory_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(clock=clock)
+    policy = BucketPolicy.per_minute(3)
+
+    assert _hits(backend, "k", policy, 4) == [0, 0, 0, 20.0]
+    clock.now += 20
+    assert _hits(backend, "k", policy, 2) == [0, 20.0]
+
+
+def test_database_bucket_is_shared_between_backends():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(RateLimitBucket.__table__.create)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        clock = FakeClock()
+        first = DatabaseRateLimitBackend(session_factory, clock)
+        second = DatabaseRateLimitBackend(session_factory, clock)
+        policy = BucketPolicy.per_minute(2)
+        results = [
+            await first.hit("k", policy),
+            await second.hit("k", policy),
+            await first.hit("k", policy),
+        ]
+        await engine.dispose()
+        return results
+
+    assert asyncio.run(run()) == [0, 0, 30.0]
+
+
+def test_login_returns_429_with_retry_after_when_email_bucket_is_empty(monkeypatch):
+    limiter = LoginRateLimiter(
+        MemoryRateLimitBackend(),
+        email_policy=BucketPolicy.per_minute(1),
+        ip_policy=BucketPolicy.per_minute(0),
+    )
+    monkeypatch.setattr(auth_router, "login_rate_limiter", limiter)
+    asyncio.run(limiter.hit("Someone@Example.com", None))
+
+    response = TestClient(app).post("/auth/login", params={"email": "someone@example.com", "password": "x"})
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "60"
+
+
+def test_login_bucket_keys_fit_the_column_for_any_email_length():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(RateLimitBucket.__table__.create)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        limiter = LoginRateLimiter(
+            DatabaseRateLimitBackend(session_factory, FakeClock()),
+            email_policy=BucketPolicy.per_minute(1),
+            ip_policy=BucketPolicy.per_minute(0),
+        )
+        email = "a" * 388 + "@example.com"
+        results = [await limiter.hit(email, None), await limiter.hit(email.upper(), None)]
+        async with session_factory() as db:
+            keys = list(await db.scalars(select(RateLimitBucket.key)))
+        await engine.dispose()
+        return results, keys
+
+    results, keys = asyncio.run(run())
+
+    assert results == [0, 60]
+    assert len(keys) == 1
+    assert len(keys[0]) <= RateLimitBucket.__table__.c.key.type.length
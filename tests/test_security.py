@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.security import PasswordHasher, PasswordHasherBusy, verify_password
+
+
+def test_password_hasher_round_trip_runs_in_worker_processes():
+    hasher = PasswordHasher(workers=1, max_queue=4)
+
+    async def run():
+        hashed = await hasher.hash("s3cret")
+        return hashed, await hasher.verify("s3cret", hashed), await hasher.verify("wrong", hashed)
+
+    try:
+        hashed, valid, invalid = asyncio.run(run())
+    finally:
+        hasher.shutdown()
+
+    assert verify_password("s3cret", hashed)
+    assert valid is True
+    assert invalid is False
+    stats = hasher.stats()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+
+
+def test_password_hasher_rejects_when_queue_is_full():
+    hasher = PasswordHasher(workers=1, max_queue=0)
+    hasher._in_flight = 1
+
+    with pytest.raises(PasswordHasherBusy):
+        asyncio.run(hasher.verify("s3cret", "not-a-hash"))
+
+
+def test_verify_and_update_rehashes_when_rounds_change(monkeypatch):
+    monkeypatch.setattr(security, "_pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=4))
+    old_hash = security.hash_password("s3cret")
+    monkeypatch.setattr(security, "_pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=5))
+
+    assert security.verify_and_update_password("wrong", old_hash) == (False, None)
+    valid, new_hash = security.verify_and_update_password("s3cret", old_hash)
+    assert valid is True
+    assert new_hash.startswith("$2b$05$")
+    assert security.verify_and_update_password("s3cret", new_hash) == (True, None)
@@ -0,0 +1,24 @@
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+
+from app.modules.delivery.routes import router as delivery_router
+from app.modules.discovery.routes import router as discovery_router
+from app.modules.inceptions.routes import router as inceptions_router
+from app.modules.workspace.router import router as workspace_router
+
+
+def test_module_read_routes_use_pydantic_dump_json_fast_path():
+    # FastAPI only serializes straight to JSON bytes when a response model is
+    # declared and the response class is left at its default.
+    routers = (workspace_router, discovery_router, delivery_router, inceptions_router)
+    routes = [
+        route
+        for router in routers
+        for route in router.routes
+        if isinstance(route, APIRoute) and "GET" in route.methods
+    ]
+
+    assert routes
+    for route in routes:
+        assert route.response_model is not None, route.path
+        assert isinstance(route.response_class, DefaultPlaceholder), route.path
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+from app.startup_profile import measure_imports
+
+
+def test_measure_imports_reports_cumulative_time_per_module():
+    records = measure_imports("json")
+
+    names = [name for name, _, _ in records]
+    assert "json" in names
+    assert all(cumulative >= self_time for _, self_time, cumulative in records)
+
+
+def test_app_import_defers_passlib_and_jose():
+    completed = subprocess.run(
+        [sys.executable, "-c", "import sys, app.main; print(sorted({'passlib', 'jose'} & set(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "[]"